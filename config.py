@@ -3,43 +3,40 @@ from __future__ import annotations
 import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent
 _FILE_SOURCED_ENV_KEYS: set[str] = set()
+# Parsed .env contents; the file is read once at import instead of on every get_env() miss.
+_DOTENV: Dict[str, str] = {}
 
 
 def _parse_env_file(path: str | Path) -> Dict[str, str]:
-    env_path = Path(path)
-    parsed: Dict[str, str] = {}
-    if not env_path.exists():
-        return parsed
-
     try:
-        with env_path.open("r", encoding="utf-8") as env_file:
-            for raw_line in env_file:
-                line = raw_line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip("'").strip('"')
-                if key:
-                    parsed[key] = value
+        text = Path(path).read_text(encoding="utf-8")
     except OSError:
         return {}
 
+    parsed: Dict[str, str] = {}
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] == "#":
+            continue
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if sep and key:
+            parsed[key] = value.strip().strip("\"'")
     return parsed
 
 
 def load_dotenv(path: str | Path = PROJECT_ROOT / ".env") -> None:
     parsed = _parse_env_file(path)
-    for key, value in parsed.items():
-        if key in os.environ:
-            continue
-        os.environ[key] = value
-        _FILE_SOURCED_ENV_KEYS.add(key)
+    _DOTENV.update(parsed)
+    missing = {key: value for key, value in parsed.items() if key not in os.environ}
+    os.environ.update(missing)
+    _FILE_SOURCED_ENV_KEYS.update(missing)
 
 
 def get_env(name: str, default: str | None = None) -> str | None:
@@ -47,16 +44,12 @@ def get_env(name: str, default: str | None = None) -> str | None:
     if current is not None:
         return current
 
-    for candidate in (PROJECT_ROOT / ".env",):
-        parsed = _parse_env_file(candidate)
-        value = parsed.get(name)
-        if value is None:
-            continue
-        os.environ[name] = value
-        _FILE_SOURCED_ENV_KEYS.add(name)
-        return value
-
-    return default
+    value = _DOTENV.get(name)
+    if value is None:
+        return default
+    os.environ[name] = value
+    _FILE_SOURCED_ENV_KEYS.add(name)
+    return value
 
 
 def _is_placeholder_path(value: str) -> bool:
@@ -85,6 +78,13 @@ except KeyError as exc:
 
 AZURE_TIMEOUT_SECONDS = float(get_env("AZURE_TIMEOUT_SECONDS", "30") or "30")
 AZURE_POOL_TIMEOUT = float(get_env("AZURE_POOL_TIMEOUT", "15") or "15")
+DB_POOL_MIN = int(get_env("DB_POOL_MIN", "4") or "4")
+_DEFAULT_DB_POOL_MAX = str(min(32, (os.cpu_count() or 1) * 4))
+DB_POOL_MAX = max(DB_POOL_MIN, int(get_env("DB_POOL_MAX", _DEFAULT_DB_POOL_MAX) or _DEFAULT_DB_POOL_MAX))
+DB_STATEMENT_TIMEOUT_MS = int(get_env("DB_STATEMENT_TIMEOUT_MS", "0") or "0")
+DB_KEEPALIVES_IDLE = int(get_env("DB_KEEPALIVES_IDLE", "30") or "30")
+DB_KEEPALIVES_INTERVAL = int(get_env("DB_KEEPALIVES_INTERVAL", "10") or "10")
+DB_KEEPALIVES_COUNT = int(get_env("DB_KEEPALIVES_COUNT", "3") or "3")
 BROADCAST_SOURCE_URL_FALLBACK = (get_env("AZ_TELEMETRY_URL", "") or "").strip()
 BROADCAST_ENDPOINT_URL = (get_env("BROADCAST_ENDPOINT_URL", "") or "").strip()
 BROADCAST_ENDPOINT_METHOD = (get_env("BROADCAST_ENDPOINT_METHOD", "GET") or "GET").strip().upper() or "GET"
@@ -128,7 +128,18 @@ PHASE_TO_PERCENT = {
 CARD_KEYS = ["development_progress", "bom", "documentation", "system_status", "tasks", "risks"]
 DOC_TYPE_FILTER_ALL = "__all__"
 
-ENTITY_DEFS: Dict[str, Dict[str, Any]] = {
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Read-only all the way down (mappings and field tuples): the SQL statements, sanitizers
+# and UI form/table specs are derived from it at import.
+ENTITY_DEFS: Mapping[str, Mapping[str, Any]] = _freeze({
     "project": {
         "label": "Project Metadata",
         "fields": [
@@ -192,4 +203,4 @@ ENTITY_DEFS: Dict[str, Dict[str, Any]] = {
             {"name": "details", "label": "Details", "widget": "textarea"},
         ],
     },
-}
+})
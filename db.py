@@ -1,27 +1,90 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import functools
+import hashlib
+import io
+import logging
+import re
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, TypeVar
 
+import psycopg2
 from flask import g
-from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
+from psycopg2 import pool, sql
+from psycopg2.extras import RealDictCursor, execute_values
 
-from config import AZURE_POOL_TIMEOUT, CARD_KEYS, DATABASE_URL
+from config import (
+    AZURE_POOL_TIMEOUT,
+    CARD_KEYS,
+    DATABASE_URL,
+    DB_KEEPALIVES_COUNT,
+    DB_KEEPALIVES_IDLE,
+    DB_KEEPALIVES_INTERVAL,
+    DB_POOL_MAX,
+    DB_POOL_MIN,
+    DB_STATEMENT_TIMEOUT_MS,
+)
 
 
 DB_POOL: pool.ThreadedConnectionPool | None = None
+_DB_POOL_LOCK = threading.Lock()
+# Bumped after every committed write through commit_db(); read caches compare against it.
+_DATA_VERSION = 0
+_DATA_VERSION_LOCK = threading.Lock()
+# Statements PREPAREd on each pooled connection: True while usable, False once the server
+# has rejected the cached plan and the statement must be deallocated and prepared again.
+_PREPARED: "weakref.WeakKeyDictionary[Any, dict[str, bool]]" = weakref.WeakKeyDictionary()
+_PARAM_RE = re.compile(r"%s")
+# Arbitrary constant shared by every process that runs init_db().
+_INIT_DB_LOCK_ID = 0x5CCDB1
+
+
+def _create_db_pool() -> pool.ThreadedConnectionPool:
+    # ThreadedConnectionPool opens minconn connections up front, so the pool starts warm.
+    # TCP keepalives let a dead server connection fail fast instead of hanging a request:
+    # after keepalives_idle seconds of silence, keepalives_count unanswered probes sent
+    # keepalives_interval seconds apart drop the connection.
+    options: Dict[str, Any] = {
+        "connect_timeout": int(AZURE_POOL_TIMEOUT),
+        "keepalives": 1,
+        "keepalives_idle": DB_KEEPALIVES_IDLE,
+        "keepalives_interval": DB_KEEPALIVES_INTERVAL,
+        "keepalives_count": DB_KEEPALIVES_COUNT,
+    }
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        options["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+    return pool.ThreadedConnectionPool(
+        minconn=DB_POOL_MIN,
+        maxconn=DB_POOL_MAX,
+        dsn=DATABASE_URL,
+        **options,
+    )
 
 
 def get_db_pool() -> pool.ThreadedConnectionPool:
+    db_pool = DB_POOL
+    if db_pool is not None:
+        return db_pool
+    return _init_db_pool()
+
+
+def _init_db_pool() -> pool.ThreadedConnectionPool:
     global DB_POOL
-    if DB_POOL is None:
-        DB_POOL = pool.ThreadedConnectionPool(
-            minconn=1,
-            maxconn=10,
-            dsn=DATABASE_URL,
-            connect_timeout=int(AZURE_POOL_TIMEOUT),
-        )
-    return DB_POOL
+    with _DB_POOL_LOCK:
+        if DB_POOL is None:
+            DB_POOL = _create_db_pool()
+        return DB_POOL
+
+
+# Open the pool while the worker imports so the first request does not pay for it.
+# If the database is unreachable right now, get_db_pool() retries on first use.
+try:
+    _init_db_pool()
+except psycopg2.Error:
+    logging.getLogger(__name__).warning("Database pool unavailable at startup; retrying on first use", exc_info=True)
 
 
 def ensure_column(db, table: str, column: str, col_type: str) -> None:
@@ -29,6 +92,37 @@ def ensure_column(db, table: str, column: str, col_type: str) -> None:
         cursor.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {col_type}")
 
 
+# Columns added after the first schema version; init_db adds any that an older database lacks.
+_UPGRADE_COLUMNS = (
+    ("development_progress", "percent", "INTEGER"),
+    ("development_progress", "phase", "TEXT"),
+    ("development_progress", "status_text", "TEXT"),
+    ("documentation", "owner", "TEXT"),
+    ("documentation", "location", "TEXT"),
+    ("documentation", "last_updated", "TEXT"),
+    ("system_status", "is_online", "INTEGER"),
+    ("tasks", "due_date", "TEXT"),
+    ("tasks", "priority", "TEXT"),
+    ("bom", "link", "TEXT"),
+    ("risks", "solution", "TEXT"),
+)
+
+
+def ensure_columns(db, columns: tuple[tuple[str, str, str], ...]) -> None:
+    # One catalog read instead of an ALTER per column; an up-to-date schema issues no ALTERs
+    # and so takes no ACCESS EXCLUSIVE locks.
+    with db.cursor() as cursor:
+        cursor.execute(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = ANY(%s)",
+            (sorted({table for table, _, _ in columns}),),
+        )
+        existing = set(cursor.fetchall())
+    for table, column, col_type in columns:
+        if (table, column) not in existing:
+            ensure_column(db, table, column, col_type)
+
+
 def init_db(db) -> None:
     schema_statements = [
         """
@@ -145,9 +239,15 @@ def init_db(db) -> None:
             status TEXT
         )
         """,
+        # Matches fetch_all's log ordering so the log is read in index order instead of sorted.
+        "CREATE INDEX IF NOT EXISTS development_log_date_id_idx ON development_log (log_date DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS tasks_due_date_idx ON tasks (due_date)",
     ]
 
     with db.cursor() as cursor:
+        # Workers started together with RUN_DB_INIT=1 would race on CREATE TABLE IF NOT EXISTS;
+        # the transaction-scoped advisory lock runs their schema setup one after another.
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (_INIT_DB_LOCK_ID,))
         for statement in schema_statements:
             cursor.execute(statement)
         cursor.execute(
@@ -155,66 +255,190 @@ def init_db(db) -> None:
             "ON CONFLICT (id) DO NOTHING"
         )
 
-    ensure_column(db, "development_progress", "percent", "INTEGER")
-    ensure_column(db, "development_progress", "phase", "TEXT")
-    ensure_column(db, "development_progress", "status_text", "TEXT")
-    ensure_column(db, "documentation", "owner", "TEXT")
-    ensure_column(db, "documentation", "location", "TEXT")
-    ensure_column(db, "documentation", "last_updated", "TEXT")
-    ensure_column(db, "system_status", "is_online", "INTEGER")
-    ensure_column(db, "tasks", "due_date", "TEXT")
-    ensure_column(db, "tasks", "priority", "TEXT")
-    ensure_column(db, "bom", "link", "TEXT")
-    ensure_column(db, "risks", "solution", "TEXT")
+    ensure_columns(db, _UPGRADE_COLUMNS)
 
     with db.cursor() as cursor:
         cursor.execute(
             "INSERT INTO development_progress (id, percent, phase, status_text) VALUES (1, NULL, '', '') "
             "ON CONFLICT (id) DO NOTHING"
         )
-        for position, key in enumerate(CARD_KEYS):
-            cursor.execute(
-                "INSERT INTO card_state (key, position, pinned) VALUES (%s, %s, 0) "
-                "ON CONFLICT (key) DO NOTHING",
-                (key, position),
-            )
+        # Seed every card in one multi-row INSERT instead of one statement per key.
+        execute_values(
+            cursor,
+            "INSERT INTO card_state (key, position, pinned) VALUES %s ON CONFLICT (key) DO NOTHING",
+            [(key, position) for position, key in enumerate(CARD_KEYS)],
+            template="(%s, %s, 0)",
+        )
 
     db.commit()
 
 
-def _to_postgres_placeholders(query: str) -> str:
-    return query.replace("?", "%s")
+@lru_cache(maxsize=None)
+def _prepared_statement(query: str) -> tuple[str, str, int]:
+    name = "scc_" + hashlib.blake2b(query.encode("utf-8"), digest_size=8).hexdigest()
+    counter = iter(range(1, query.count("%s") + 1))
+    body = _PARAM_RE.sub(lambda _: f"${next(counter)}", query)
+    return name, f"PREPARE {name} AS {body}", query.count("%s")
+
+
+def _execute(cursor, query: str, params: List[Any] | tuple[Any, ...] | None, prepare: bool) -> None:
+    if not prepare:
+        cursor.execute(query, params)
+        return
+
+    name, prepare_sql, param_count = _prepared_statement(query)
+    prepared = _PREPARED.setdefault(cursor.connection, {})
+    execute_sql = f"EXECUTE {name} ({', '.join(['%s'] * param_count)})" if param_count else f"EXECUTE {name}"
+    if not prepared.get(name):
+        _prepare(cursor, name, prepare_sql, prepared)
+    try:
+        cursor.execute(execute_sql, params if param_count else None)
+    except psycopg2.errors.FeatureNotSupported:
+        # "cached plan must not change result type": an ALTER TABLE (init_db in another
+        # process) changed the row type behind a SELECT * statement. Re-prepare it; inside
+        # an open transaction the error has already aborted it, so leave that to the next use.
+        prepared[name] = False
+        if not cursor.connection.autocommit:
+            raise
+        _prepare(cursor, name, prepare_sql, prepared)
+        cursor.execute(execute_sql, params if param_count else None)
 
 
+def _prepare(cursor, name: str, prepare_sql: str, prepared: dict[str, bool]) -> None:
+    if name in prepared:
+        cursor.execute(f"DEALLOCATE {name}")
+    cursor.execute(prepare_sql)
+    prepared[name] = True
+
+
+_T = TypeVar("_T")
+
+
+# Check out one pooled connection for a read-only handler and pass it in as ``db``,
+# bypassing the flask.g lookup that get_db() does on every helper call. Reads run
+# in autocommit, so there is no transaction to roll back on the way out.
+def with_conn(func: Callable[..., _T]) -> Callable[..., _T]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> _T:
+        db_pool = get_db_pool()
+        db = db_pool.getconn()
+        db.autocommit = True
+        try:
+            return func(*args, db=db, **kwargs)
+        finally:
+            _release(db_pool, db, dirty=False)
+
+    return wrapper
+
+
+def _release(db_pool: pool.ThreadedConnectionPool, db, dirty: bool) -> None:
+    try:
+        if dirty:
+            db.rollback()
+        db.autocommit = False
+    except Exception:
+        pass
+    db_pool.putconn(db)
+
+
+# The request connection starts in autocommit so plain reads never open a
+# transaction; the first write switches it to a regular transaction.
 def get_db():
     if "db" not in g:
-        g.db = get_db_pool().getconn()
+        db = get_db_pool().getconn()
+        db.autocommit = True
+        g.db = db
     return g.db
 
 
+def get_write_db():
+    db = get_db()
+    if db.autocommit:
+        db.autocommit = False
+        g.db_dirty = True
+    return db
+
+
+def data_version() -> int:
+    return _DATA_VERSION
+
+
+def commit_db() -> None:
+    global _DATA_VERSION
+    get_db().commit()
+    with _DATA_VERSION_LOCK:
+        _DATA_VERSION += 1
+
+
+# One transaction around a group of writes: a single commit (and data version bump) on
+# success, an immediate rollback if any statement fails.
+@contextmanager
+def tx() -> Iterator[Any]:
+    db = get_write_db()
+    try:
+        yield db
+    except BaseException:
+        db.rollback()
+        raise
+    commit_db()
+
+
 def close_db(exc: Exception | None) -> None:
     db = g.pop("db", None)
+    dirty = g.pop("db_dirty", False)
     if db is not None:
-        try:
-            db.rollback()
-        except Exception:
-            pass
-        get_db_pool().putconn(db)
+        _release(get_db_pool(), db, dirty)
+
+
+def fetch_one(
+    query: str,
+    params: List[Any] | tuple[Any, ...] | None = None,
+    prepare: bool = False,
+    db=None,
+) -> Dict[str, Any] | None:
+    with (db if db is not None else get_db()).cursor(cursor_factory=RealDictCursor) as cursor:
+        _execute(cursor, query, params, prepare)
+        return cursor.fetchone()
+
+
+def fetch_all_rows(
+    query: str,
+    params: List[Any] | tuple[Any, ...] | None = None,
+    prepare: bool = False,
+    db=None,
+) -> List[Dict[str, Any]]:
+    with (db if db is not None else get_db()).cursor(cursor_factory=RealDictCursor) as cursor:
+        _execute(cursor, query, params, prepare)
+        return cursor.fetchall()
+
+
+def execute_sql(query: str, params: List[Any] | tuple[Any, ...] | None = None, db=None) -> None:
+    with (db if db is not None else get_write_db()).cursor() as cursor:
+        cursor.execute(query, params)
 
 
-def fetch_one(query: str, params: List[Any] | tuple[Any, ...] | None = None) -> Dict[str, Any] | None:
-    with get_db().cursor(cursor_factory=RealDictCursor) as cursor:
-        cursor.execute(_to_postgres_placeholders(query), params)
-        row = cursor.fetchone()
-        return dict(row) if row is not None else None
+def execute_sql_values(query: str, rows: List[List[Any]] | List[tuple[Any, ...]]) -> None:
+    with get_write_db().cursor() as cursor:
+        execute_values(cursor, query, rows)
 
 
-def fetch_all_rows(query: str, params: List[Any] | tuple[Any, ...] | None = None) -> List[Dict[str, Any]]:
-    with get_db().cursor(cursor_factory=RealDictCursor) as cursor:
-        cursor.execute(_to_postgres_placeholders(query), params)
-        return [dict(row) for row in cursor.fetchall()]
+def _copy_text(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
 
 
-def execute_sql(query: str, params: List[Any] | tuple[Any, ...] | None = None) -> None:
-    with get_db().cursor() as cursor:
-        cursor.execute(_to_postgres_placeholders(query), params)
+# COPY streams all rows in one statement with no per-row parse/bind. Text format is used
+# rather than CSV so that NULL and the empty string stay distinct.
+def copy_rows(table: str, columns: tuple[str, ...], rows: List[List[Any]] | List[tuple[Any, ...]]) -> None:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_text(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+    )
+    with get_write_db().cursor() as cursor:
+        cursor.copy_expert(statement, buffer)
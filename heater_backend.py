@@ -4,77 +4,96 @@ import ast
 import importlib.util
 import os
 import pkgutil
+import re
+import sys
+import threading
+import time
 from typing import Any
 from urllib.parse import urlsplit
 
+import msgspec
+import orjson
 import requests
-from flask import Flask, jsonify, request
-
-# Python 3.14 compatibility: legacy AST node aliases removed.
-if not hasattr(ast, "Str"):
-    ast.Str = ast.Constant  # type: ignore[attr-defined]
-if not hasattr(ast, "Bytes"):
-    ast.Bytes = ast.Constant  # type: ignore[attr-defined]
-if not hasattr(ast, "Num"):
-    ast.Num = ast.Constant  # type: ignore[attr-defined]
-if not hasattr(ast, "NameConstant"):
-    ast.NameConstant = ast.Constant  # type: ignore[attr-defined]
-
-# Provide legacy ast.Constant attribute access expected by older Werkzeug code.
-if not hasattr(ast.Constant, "s"):
-    def _get_s(self):
-        return self.value
-
-    def _set_s(self, value):
-        self.value = value
-
-    ast.Constant.s = property(_get_s, _set_s)  # type: ignore[attr-defined]
-
-if not hasattr(ast.Constant, "n"):
-    def _get_n(self):
-        return self.value
-
-    def _set_n(self, value):
-        self.value = value
-
-    ast.Constant.n = property(_get_n, _set_n)  # type: ignore[attr-defined]
-
-# Flask compatibility for Python 3.14 where pkgutil.get_loader was removed.
-if not hasattr(pkgutil, "get_loader"):
-    def _get_loader(name: str):
-        try:
-            spec = importlib.util.find_spec(name)
-        except (ValueError, ImportError):
-            return None
-        return spec.loader if spec else None
-
-    pkgutil.get_loader = _get_loader  # type: ignore[attr-defined]
+from flask import Flask, g, jsonify, request
+from requests.adapters import HTTPAdapter
+from werkzeug.middleware.profiler import ProfilerMiddleware
+from urllib3.util.retry import Retry
+
+# The shims below only matter on Python 3.14+; older interpreters still ship
+# these names natively, so skip the probes (and their deprecation warnings).
+if sys.version_info >= (3, 14):
+    # Python 3.14 compatibility: legacy AST node aliases removed.
+    if not hasattr(ast, "Str"):
+        ast.Str = ast.Constant  # type: ignore[attr-defined]
+    if not hasattr(ast, "Bytes"):
+        ast.Bytes = ast.Constant  # type: ignore[attr-defined]
+    if not hasattr(ast, "Num"):
+        ast.Num = ast.Constant  # type: ignore[attr-defined]
+    if not hasattr(ast, "NameConstant"):
+        ast.NameConstant = ast.Constant  # type: ignore[attr-defined]
+
+    # Provide legacy ast.Constant attribute access expected by older Werkzeug code.
+    if not hasattr(ast.Constant, "s"):
+        def _get_s(self):
+            return self.value
+
+        def _set_s(self, value):
+            self.value = value
+
+        ast.Constant.s = property(_get_s, _set_s)  # type: ignore[attr-defined]
+
+    if not hasattr(ast.Constant, "n"):
+        def _get_n(self):
+            return self.value
+
+        def _set_n(self, value):
+            self.value = value
+
+        ast.Constant.n = property(_get_n, _set_n)  # type: ignore[attr-defined]
+
+    # Flask compatibility for Python 3.14 where pkgutil.get_loader was removed.
+    if not hasattr(pkgutil, "get_loader"):
+        def _get_loader(name: str):
+            try:
+                spec = importlib.util.find_spec(name)
+            except (ValueError, ImportError):
+                return None
+            return spec.loader if spec else None
+
+        pkgutil.get_loader = _get_loader  # type: ignore[attr-defined]
 
 app = Flask(__name__)
 _FILE_SOURCED_ENV_KEYS: set[str] = set()
 
 
-def _parse_env_file(path: str) -> dict[str, str]:
-    if not os.path.exists(path):
-        return {}
+# KEY=value per line; quoted values keep their contents verbatim, unquoted values
+# drop a trailing " # comment".
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|(.*?))(?:[ \t]+#.*?)?[ \t\r]*$""",
+    re.MULTILINE,
+)
 
-    parsed: dict[str, str] = {}
+
+def _parse_env_file(path: str) -> dict[str, str]:
     try:
         with open(path, "r", encoding="utf-8") as env_file:
-            for raw_line in env_file:
-                line = raw_line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip("'").strip('"')
-                if key:
-                    parsed[key] = value
+            data = env_file.read()
+    except FileNotFoundError:
+        return {}
     except OSError:
         app.logger.exception("Failed to read %s", path)
         return {}
 
+    parsed: dict[str, str] = {}
+    for match in _ENV_LINE_RE.finditer(data):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            parsed[key] = double_quoted
+        elif single_quoted is not None:
+            parsed[key] = single_quoted
+        else:
+            parsed[key] = bare.strip("'\"")
     return parsed
 
 
@@ -114,25 +133,52 @@ def get_env(name: str, default: str | None = None) -> str | None:
 load_dotenv()
 
 AZURE_TIMEOUT_SECONDS = float(get_env("AZURE_TIMEOUT_SECONDS", "5") or "5")
-CORS_ALLOWED_ORIGINS = {
+# Size the keep-alive pool to the number of relay calls that can be in flight at
+# once (worker threads), so concurrent requests never queue for a connection.
+AZURE_POOL_MAXSIZE = int(get_env("AZURE_POOL_MAXSIZE", "64") or "64")
+TELEMETRY_TTL_SECONDS = float(get_env("TELEMETRY_TTL_MS", "500") or "500") / 1000
+CORS_ALLOWED_ORIGINS = frozenset(
     origin.strip()
     for origin in (get_env(
         "CORS_ALLOWED_ORIGINS",
         "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173,http://127.0.0.1:5173",
     ) or "").split(",")
     if origin.strip()
+)
+_CORS_WILDCARD = "*" in CORS_ALLOWED_ORIGINS
+_STATIC_CORS = {
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+    "Access-Control-Max-Age": "600",
 }
 
-
-def required_env(name: str) -> str:
+def configured_env(name: str) -> str | None:
     value = get_env(name)
     if not value:
-        raise RuntimeError(f"{name} is not configured")
+        return None
     if any(marker in value for marker in ("your-function-app", "your-function-key", "/absolute/path/")):
-        raise RuntimeError(f"{name} is not configured")
+        return None
     return value
 
 
+# Relay targets are resolved once at startup; restart the app after editing .env.
+AZ_TELEMETRY_URL = configured_env("AZ_TELEMETRY_URL")
+AZ_COMMAND_URL = configured_env("AZ_COMMAND_URL")
+
+# Shared session so relay calls reuse pooled keep-alive connections instead of
+# paying a fresh TCP+TLS handshake to Azure on every request. The adapter pool
+# is thread-safe, so a threaded server (gunicorn gthread, like startup.sh) can
+# overlap many Azure round trips in one process.
+_SESSION = requests.Session()
+_SESSION_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=AZURE_POOL_MAXSIZE,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504)),
+)
+_SESSION.mount("https://", _SESSION_ADAPTER)
+_SESSION.mount("http://", _SESSION_ADAPTER)
+
+
 def describe_relay_target(url: str) -> str:
     parts = urlsplit(url)
     if not parts.scheme or not parts.netloc:
@@ -140,105 +186,246 @@ def describe_relay_target(url: str) -> str:
     return f"{parts.scheme}://{parts.netloc}{parts.path or '/'}"
 
 
-def azure_json_request(method: str, url: str, payload: dict[str, Any] | None = None) -> tuple[Any, int]:
+def is_json_content_type(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def relay_unavailable(url: str) -> tuple[bytes, str, int]:
+    app.logger.exception("Azure relay request failed")
     target = describe_relay_target(url)
+    return orjson.dumps({"error": f"Azure relay is unavailable for {target}"}), "application/json", 502
+
+
+def azure_get(url: str) -> tuple[bytes, str, int]:
     try:
-        response = requests.request(method, url, json=payload, timeout=AZURE_TIMEOUT_SECONDS)
+        response = _SESSION.get(url, timeout=AZURE_TIMEOUT_SECONDS)
     except requests.RequestException:
-        app.logger.exception("Azure relay request failed")
-        return {"error": f"Azure relay is unavailable for {target}"}, 502
+        return relay_unavailable(url)
+    return relay_result(response, url)
 
+
+def azure_post(url: str, body: bytes) -> tuple[bytes, str, int]:
     try:
-        body: Any = response.json()
-    except ValueError:
-        body = {"raw": response.text}
+        response = _SESSION.post(url, data=body, headers=_JSON_HEADERS, timeout=AZURE_TIMEOUT_SECONDS)
+    except requests.RequestException:
+        return relay_unavailable(url)
+    return relay_result(response, url)
+
+
+def relay_result(response: requests.Response, url: str) -> tuple[bytes, str, int]:
+    status = response.status_code
+    content_type = response.headers.get("Content-Type", "")
+    # Successful JSON is forwarded verbatim; only error and non-JSON bodies get parsed.
+    if status < 400 and response.content and is_json_content_type(content_type):
+        return response.content, content_type, status
+
+    if status == 204:
+        return b"", "application/json", 204
 
-    if response.status_code >= 400:
-        error = f"Azure relay returned {response.status_code} for {target}"
-        if response.status_code == 404:
+    body: Any
+    if not response.content:
+        body = {}
+    else:
+        try:
+            body = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            body = {"raw": response.text}
+
+    if status >= 400:
+        target = describe_relay_target(url)
+        error = f"Azure relay returned {status} for {target}"
+        if status == 404:
             error += ". Check the Azure Function route/key and restart the app if you recently changed .env."
         if body not in ({}, {"raw": ""}, ""):
             error += f": {body}"
-        return {
+        body = {
             "error": error,
-            "status": response.status_code,
+            "status": status,
             "response": body,
-        }, response.status_code
+        }
+
+    return orjson.dumps(body), "application/json", status
+
+
+# Every browser polls telemetry on the same cadence; serve them one upstream
+# response per TTL window. The lock makes concurrent pollers wait for a single fetch.
+_TELEMETRY_CACHE: tuple[float, bytes, str, int] | None = None
+_TELEMETRY_LOCK = threading.Lock()
 
-    return body, response.status_code
 
+def relay_telemetry(url: str) -> tuple[bytes, str, int]:
+    global _TELEMETRY_CACHE
+    if TELEMETRY_TTL_SECONDS <= 0:
+        return azure_get(url)
 
-def cors_origin_for_request() -> str | None:
-    origin = request.headers.get("Origin")
+    with _TELEMETRY_LOCK:
+        cached = _TELEMETRY_CACHE
+        if cached is not None and time.monotonic() - cached[0] < TELEMETRY_TTL_SECONDS:
+            return cached[1:]
+        body, content_type, status = azure_get(url)
+        _TELEMETRY_CACHE = (time.monotonic(), body, content_type, status)
+        return body, content_type, status
+
+
+class _CommandFlight:
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: tuple[bytes, str, int] | None = None
+
+
+# Identical commands that arrive while one is already in flight (double clicks) share
+# that upstream call instead of queueing their own. Only commands that set an absolute
+# state are coalesced; anything else (a step, pulse or toggle) is sent every time.
+IDEMPOTENT_COMMAND_TYPES = frozenset({"SHUTDOWN", "RESUME"})
+_COMMAND_FLIGHTS: dict[bytes, _CommandFlight] = {}
+_COMMAND_FLIGHTS_LOCK = threading.Lock()
+
+
+def relay_command(url: str, body: bytes, coalesce: bool = False) -> tuple[bytes, str, int]:
+    if not coalesce:
+        return azure_post(url, body)
+
+    with _COMMAND_FLIGHTS_LOCK:
+        flight = _COMMAND_FLIGHTS.get(body)
+        leader = flight is None
+        if leader:
+            flight = _COMMAND_FLIGHTS[body] = _CommandFlight()
+
+    if not leader:
+        flight.done.wait()
+        if flight.result is not None:
+            return flight.result
+        return azure_post(url, body)
+
+    try:
+        flight.result = azure_post(url, body)
+        return flight.result
+    finally:
+        with _COMMAND_FLIGHTS_LOCK:
+            _COMMAND_FLIGHTS.pop(body, None)
+        flight.done.set()
+
+
+class CommandMsg(msgspec.Struct):
+    type: str
+    value: Any
+
+
+# Parses and validates the command body in a single pass; the encoder turns the
+# normalized struct straight into the upstream request body.
+_COMMAND_DECODER = msgspec.json.Decoder(CommandMsg)
+_COMMAND_ENCODER = msgspec.json.Encoder()
+
+
+def relay_response(body: bytes, content_type: str, status: int):
+    return app.response_class(body, status=status, content_type=content_type or "application/json")
+
+
+def cors_origin_for(origin: str | None) -> str | None:
     if not origin:
         return None
-    if "*" in CORS_ALLOWED_ORIGINS:
+    if _CORS_WILDCARD:
         return "*"
-    if origin in CORS_ALLOWED_ORIGINS:
-        return origin
-    return None
+    return origin if origin in CORS_ALLOWED_ORIGINS else None
+
+
+_PREFLIGHT_HEADERS = [*_STATIC_CORS.items(), ("Content-Length", "0")]
+
+
+# Answer API preflights before Flask builds a request context for them.
+def cors_preflight_middleware(wsgi_app):
+    def middleware(environ, start_response):
+        if environ.get("REQUEST_METHOD") == "OPTIONS" and environ.get("PATH_INFO", "").startswith("/api/"):
+            headers = list(_PREFLIGHT_HEADERS)
+            origin = cors_origin_for(environ.get("HTTP_ORIGIN"))
+            if origin:
+                headers.append(("Access-Control-Allow-Origin", origin))
+                if origin != "*":
+                    headers.append(("Vary", "Origin"))
+            start_response("204 No Content", headers)
+            return [b""]
+        return wsgi_app(environ, start_response)
+
+    return middleware
+
+
+app.wsgi_app = cors_preflight_middleware(app.wsgi_app)
 
 
 @app.before_request
-def api_cors_preflight():
-    if request.method == "OPTIONS" and request.path.startswith("/api/"):
-        return "", 204
+def mark_api_request():
+    g.t0 = time.perf_counter_ns()
+    g.is_api = request.path.startswith("/api/")
+
+
+# Local handling time (excluding the WSGI server) shows up in browser devtools.
+@app.after_request
+def add_server_timing(response):
+    t0 = getattr(g, "t0", None)
+    if t0 is not None:
+        response.headers["Server-Timing"] = f"app;dur={(time.perf_counter_ns() - t0) / 1e6:.2f}"
+    return response
 
 
 @app.after_request
 def add_api_cors_headers(response):
-    if not request.path.startswith("/api/"):
+    if not getattr(g, "is_api", False):
         return response
 
-    origin = cors_origin_for_request()
+    origin = cors_origin_for(request.headers.get("Origin"))
     if origin:
         response.headers["Access-Control-Allow-Origin"] = origin
         if origin != "*":
             response.headers["Vary"] = "Origin"
 
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
-    response.headers["Access-Control-Max-Age"] = "600"
+    response.headers.update(_STATIC_CORS)
     return response
 
 
-@app.route("/api/telemetry", methods=["GET"])
+@app.route("/api/telemetry", methods=["GET"], strict_slashes=False)
 def api_telemetry():
-    try:
-        url = required_env("AZ_TELEMETRY_URL")
-    except RuntimeError:
-        app.logger.exception("AZ_TELEMETRY_URL is missing")
+    if not AZ_TELEMETRY_URL:
+        app.logger.error("AZ_TELEMETRY_URL is not configured")
         return jsonify({"error": "Server is not configured for telemetry relay"}), 500
 
-    body, status = azure_json_request("GET", url)
-    return jsonify(body), status
+    return relay_response(*relay_telemetry(AZ_TELEMETRY_URL))
 
 
-@app.route("/api/command", methods=["POST"])
+@app.route("/api/command", methods=["POST"], strict_slashes=False)
 def api_command():
-    payload = request.get_json(silent=True)
-    if not isinstance(payload, dict):
+    try:
+        msg = _COMMAND_DECODER.decode(request.get_data(cache=False))
+    except msgspec.ValidationError as exc:
+        return jsonify({"error": f"Invalid command: {exc}"}), 400
+    except msgspec.DecodeError:
         return jsonify({"error": "Expected a JSON object body"}), 400
 
-    cmd_type = payload.get("type")
-    if not isinstance(cmd_type, str) or not cmd_type.strip():
+    msg.type = msg.type.strip()
+    if not msg.type:
         return jsonify({"error": "Field 'type' must be a non-empty string"}), 400
-    if "value" not in payload:
-        return jsonify({"error": "Field 'value' is required"}), 400
-
-    forward_payload = {
-        "type": cmd_type.strip(),
-        "value": payload["value"],
-    }
 
-    try:
-        url = required_env("AZ_COMMAND_URL")
-    except RuntimeError:
-        app.logger.exception("AZ_COMMAND_URL is missing")
+    if not AZ_COMMAND_URL:
+        app.logger.error("AZ_COMMAND_URL is not configured")
         return jsonify({"error": "Server is not configured for command relay"}), 500
 
-    body, status = azure_json_request("POST", url, payload=forward_payload)
-    return jsonify(body), status
+    return relay_response(
+        *relay_command(
+            AZ_COMMAND_URL,
+            _COMMAND_ENCODER.encode(msg),
+            coalesce=msg.type in IDEMPOTENT_COMMAND_TYPES,
+        )
+    )
+
+
+if get_env("PROFILE", "0") == "1":
+    os.makedirs("profiles", exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30], profile_dir="profiles")
 
 
 if __name__ == "__main__":
@@ -246,4 +433,5 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=int(os.environ.get("PORT", "5000")),
         debug=os.environ.get("FLASK_DEBUG", "0") == "1",
+        threaded=True,
     )
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import csv
+import time
 from datetime import datetime
-from io import BytesIO
+from io import BytesIO, StringIO
 from pathlib import Path
 
+import orjson
 from flask import jsonify, redirect, request, send_file
 from werkzeug.utils import secure_filename
 
-from db import fetch_one
+from db import data_version, fetch_one, with_conn
 from services.heater_telemetry_source import load_heater_telemetry_safe, send_heater_command
 from services.blob_export import (
     download_documentation_blob,
@@ -15,13 +18,16 @@ from services.blob_export import (
     upload_documentation_file_to_blob,
 )
 from services.dashboard import (
+    copy_insert_entity,
     delete_entity,
     entity_or_404,
     fetch_all,
     fetch_current_system_status,
+    fetch_dashboard_bundle,
     fetch_development_progress,
     fetch_project,
     insert_entity,
+    insert_entity_many,
     upsert_current_system_status,
     update_entity,
     update_progress,
@@ -39,6 +45,11 @@ from services.iot_hub_telemetry import iot_hub_telemetry_status_summary
 from services.telemetry import read_telemetry_log_csv, telemetry_log_sample_count
 
 
+API_DATA_TTL_SECONDS = 2.0
+# (data version, monotonic time, encoded body) of the last /api/data response.
+_api_data_cache: tuple[int, float, bytes] | None = None
+
+
 def register_api_routes(app) -> None:
     def telemetry_has_signal(telemetry):
         return any(
@@ -55,42 +66,60 @@ def register_api_routes(app) -> None:
             return jsonify({"error": message}), 503
         return jsonify({"error": message}), 502
 
-    @app.route("/api/data")
-    def api_data():
-        return jsonify(
+    def json_response(obj, status: int = 200):
+        return app.response_class(orjson.dumps(obj), status=status, mimetype="application/json")
+
+    @with_conn
+    def api_data_body(db) -> bytes:
+        # One bundled query instead of eight: the full log, and tasks in fetch_all's id DESC order.
+        bundle = fetch_dashboard_bundle(db=db, log_limit=None, board_order=False)
+        return orjson.dumps(
             {
-                "project": fetch_project(),
-                "development_progress": fetch_development_progress(),
-                "bom": fetch_all("bom"),
-                "documentation": fetch_all("documentation"),
-                "system_status": fetch_all("system_status"),
-                "tasks": fetch_all("tasks"),
-                "risks": fetch_all("risks"),
-                "development_log": fetch_all("development_log"),
+                "project": bundle["project"],
+                "development_progress": bundle["development_progress"],
+                "bom": bundle["bom"],
+                "documentation": bundle["documentation"],
+                "system_status": bundle["system_status"],
+                "tasks": bundle["tasks"],
+                "risks": bundle["risks"],
+                "development_log": bundle["development_log"],
                 "last_updated": datetime.now().isoformat(timespec="minutes"),
             }
         )
 
+    @app.route("/api/data")
+    def api_data():
+        global _api_data_cache
+        version = data_version()
+        cached = _api_data_cache
+        if cached is not None and cached[0] == version and time.monotonic() - cached[1] < API_DATA_TTL_SECONDS:
+            body = cached[2]
+        else:
+            body = api_data_body()
+            _api_data_cache = (version, time.monotonic(), body)
+        return app.response_class(body, mimetype="application/json")
+
     @app.route("/api/db-health")
-    def api_db_health():
-        row = fetch_one("SELECT 1 AS ok")
-        return jsonify({"ok": bool(row and row.get("ok") == 1)})
+    @with_conn
+    def api_db_health(db):
+        row = fetch_one("SELECT 1 AS ok", db=db)
+        return json_response({"ok": bool(row and row.get("ok") == 1)})
 
     @app.route("/api/project", methods=["GET", "PUT"])
     def api_project():
         if request.method == "GET":
-            return jsonify(fetch_project())
+            return json_response(fetch_project())
         payload = request.get_json(silent=True) or {}
         update_project(payload)
-        return jsonify({"ok": True})
+        return json_response({"ok": True})
 
     @app.route("/api/development_progress", methods=["GET", "PUT"])
     def api_progress():
         if request.method == "GET":
-            return jsonify(fetch_development_progress())
+            return json_response(fetch_development_progress())
         payload = request.get_json(silent=True) or {}
         update_progress(payload)
-        return jsonify({"ok": True})
+        return json_response({"ok": True})
 
     @app.route("/api/telemetry", methods=["GET"])
     def api_telemetry():
@@ -304,17 +333,33 @@ def register_api_routes(app) -> None:
     def api_entity_collection(entity: str):
         entity_or_404(entity)
         if request.method == "GET":
-            return jsonify(fetch_all(entity))
+            return json_response(fetch_all(entity))
         payload = request.get_json(silent=True) or {}
+        if isinstance(payload, list):
+            if not all(isinstance(item, dict) for item in payload):
+                return json_response({"error": "Expected a JSON array of objects"}, 400)
+            return json_response({"ok": True, "count": insert_entity_many(entity, payload)})
         insert_entity(entity, payload)
-        return jsonify({"ok": True})
+        return json_response({"ok": True})
+
+    @app.route("/api/<entity>/bulk", methods=["POST"])
+    def api_entity_bulk(entity: str):
+        entity_or_404(entity)
+        # Accepts a JSON array of objects or a CSV body whose header row names the fields.
+        if request.mimetype == "text/csv":
+            payload = list(csv.DictReader(StringIO(request.get_data(as_text=True))))
+        else:
+            payload = request.get_json(silent=True)
+        if not isinstance(payload, list) or not all(isinstance(item, dict) for item in payload):
+            return json_response({"error": "Expected a JSON array of objects or a CSV body"}, 400)
+        return json_response({"ok": True, "count": copy_insert_entity(entity, payload)})
 
     @app.route("/api/<entity>/<int:item_id>", methods=["PUT", "DELETE"])
     def api_entity_item(entity: str, item_id: int):
         entity_or_404(entity)
         if request.method == "DELETE":
             delete_entity(entity, item_id)
-            return jsonify({"ok": True})
+            return json_response({"ok": True})
         payload = request.get_json(silent=True) or {}
         update_entity(entity, item_id, payload)
-        return jsonify({"ok": True})
+        return json_response({"ok": True})
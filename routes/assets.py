@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import gzip
+
+from flask import request
+
+from ui.styles import GLASS_CSS_BYTES, GLASS_CSS_ETAG
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional; gzip is served instead
+    brotli = None
+
+
+# Compressed once at import; each variant keeps its own strong ETag.
+_GLASS_CSS_VARIANTS: list[tuple[str, bytes, str]] = []
+if brotli is not None:
+    _GLASS_CSS_VARIANTS.append(("br", brotli.compress(GLASS_CSS_BYTES, quality=11), f"{GLASS_CSS_ETAG}-br"))
+_GLASS_CSS_VARIANTS.append(("gzip", gzip.compress(GLASS_CSS_BYTES, compresslevel=9, mtime=0), f"{GLASS_CSS_ETAG}-gz"))
+
+
+def register_asset_routes(app) -> None:
+    @app.route("/static/glass.css")
+    def glass_css():
+        body, etag, encoding = GLASS_CSS_BYTES, GLASS_CSS_ETAG, None
+        for candidate, compressed, candidate_etag in _GLASS_CSS_VARIANTS:
+            if request.accept_encodings[candidate]:
+                body, etag, encoding = compressed, candidate_etag, candidate
+                break
+
+        response = app.response_class(body, mimetype="text/css")
+        if encoding:
+            response.content_encoding = encoding
+        response.vary.add("Accept-Encoding")
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+        return response.make_conditional(request)
@@ -23,7 +23,7 @@ from config import (
     BROADCAST_ENDPOINT_URL,
     BROADCAST_SOURCE_URL_FALLBACK,
 )
-from db import execute_sql, fetch_one, get_db
+from db import execute_sql, fetch_one, tx
 from services.telemetry import read_telemetry_log_csv
 
 try:
@@ -253,19 +253,19 @@ def _upsert_documentation_entry(blob_url: str, row_count: int, exported_at: date
         (title, "Broadcast CSV Export"),
     )
 
-    if existing:
-        execute_sql(
-            "UPDATE documentation SET title = %s, doc_type = %s, owner = %s, location = %s, status = %s, last_updated = %s "
-            "WHERE id = %s",
-            (title, doc_type, owner, blob_url, status, last_updated, existing["id"]),
-        )
-    else:
-        execute_sql(
-            "INSERT INTO documentation (title, doc_type, owner, location, status, last_updated) "
-            "VALUES (%s, %s, %s, %s, %s, %s)",
-            (title, doc_type, owner, blob_url, status, last_updated),
-        )
-    get_db().commit()
+    with tx():
+        if existing:
+            execute_sql(
+                "UPDATE documentation SET title = %s, doc_type = %s, owner = %s, location = %s, status = %s, last_updated = %s "
+                "WHERE id = %s",
+                (title, doc_type, owner, blob_url, status, last_updated, existing["id"]),
+            )
+        else:
+            execute_sql(
+                "INSERT INTO documentation (title, doc_type, owner, location, status, last_updated) "
+                "VALUES (%s, %s, %s, %s, %s, %s)",
+                (title, doc_type, owner, blob_url, status, last_updated),
+            )
 
 
 def _insert_documentation_entry(
@@ -277,16 +277,13 @@ def _insert_documentation_entry(
     exported_at: datetime,
 ) -> int:
     last_updated = exported_at.strftime("%Y-%m-%d")
-    execute_sql(
-        "INSERT INTO documentation (title, doc_type, owner, location, status, last_updated) "
-        "VALUES (%s, %s, %s, %s, %s, %s)",
-        (title, doc_type, owner, location, status, last_updated),
-    )
-    row = fetch_one(
-        "SELECT id FROM documentation WHERE location = %s ORDER BY id DESC LIMIT 1",
-        (location,),
-    )
-    get_db().commit()
+    # RETURNING hands back the new id without a second lookup by location.
+    with tx():
+        row = fetch_one(
+            "INSERT INTO documentation (title, doc_type, owner, location, status, last_updated) "
+            "VALUES (%s, %s, %s, %s, %s, %s) RETURNING id",
+            (title, doc_type, owner, location, status, last_updated),
+        )
     return int(row["id"]) if row else 0
 
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Mapping
 
 from flask import abort, current_app, has_app_context
 
 from config import CARD_KEYS, ENTITY_DEFS, PHASES, PHASE_TO_PERCENT
-from db import execute_sql, fetch_all_rows, fetch_one, get_db
+from db import copy_rows, execute_sql, execute_sql_values, fetch_all_rows, fetch_one, tx
 
 
 def _logger() -> logging.Logger:
@@ -16,27 +19,132 @@ def _logger() -> logging.Logger:
     return logging.getLogger(__name__)
 
 
-def fetch_project() -> Dict[str, Any]:
-    row = fetch_one("SELECT * FROM project WHERE id = 1")
+# strftime is comparatively slow; the formatted wall-clock minute is reused until it ticks.
+_minute_cache: tuple[int, str] = (-1, "")
+
+
+def now_minute_str() -> str:
+    global _minute_cache
+    minute = int(time.time() // 60)
+    cached = _minute_cache
+    if cached[0] != minute:
+        cached = (minute, datetime.now().strftime("%Y-%m-%d %H:%M"))
+        _minute_cache = cached
+    return cached[1]
+
+
+def today_str() -> str:
+    return now_minute_str()[:10]
+
+
+def fetch_project(db=None) -> Dict[str, Any]:
+    row = fetch_one("SELECT * FROM project WHERE id = 1", prepare=True, db=db)
     if row is None:
         return {"name": "", "phase": ""}
     return row
 
 
-def fetch_development_progress() -> Dict[str, Any]:
-    row = fetch_one("SELECT * FROM development_progress WHERE id = 1")
+def fetch_development_progress(db=None) -> Dict[str, Any]:
+    row = fetch_one("SELECT * FROM development_progress WHERE id = 1", prepare=True, db=db)
     if row is None:
         return {"percent": None, "phase": "", "status_text": ""}
     return row
 
 
-def fetch_all(entity: str) -> List[Dict[str, Any]]:
+def fetch_all(entity: str, db=None) -> List[Dict[str, Any]]:
     if entity == "development_log":
-        return fetch_all_rows("SELECT * FROM development_log ORDER BY log_date DESC, id DESC")
-    return fetch_all_rows(f"SELECT * FROM {entity} ORDER BY id DESC")
+        return fetch_all_rows("SELECT * FROM development_log ORDER BY log_date DESC, id DESC", prepare=True, db=db)
+    return fetch_all_rows(f"SELECT * FROM {entity} ORDER BY id DESC", prepare=True, db=db)
+
+
+_LIST_ORDER_BY = {"development_log": "log_date DESC, id DESC"}
+# Board order by priority; the SQL ORDER BY and the sort in build_tasks_view share this table.
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+_DEFAULT_PRIORITY_RANK = _PRIORITY_RANK["medium"]
+# Tasks arrive in board order (priority, then ISO due date) so the Python sort in
+# build_tasks_view only has to fix up non-ISO dates.
+_TASKS_ORDER_BY = (
+    "CASE lower(priority) "
+    + "".join(f"WHEN '{name}' THEN {rank} " for name, rank in _PRIORITY_RANK.items())
+    + f"ELSE {_DEFAULT_PRIORITY_RANK} END, "
+    "CASE WHEN due_date ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}$' THEN due_date END COLLATE \"C\" NULLS LAST, "
+    "id DESC"
+)
+_BUNDLE_LIST_ENTITIES = tuple(key for key in ENTITY_DEFS if key != "project")
+# The log only grows; the dashboard view carries the newest entries. API callers pass
+# log_limit=None to get the full history.
+DASHBOARD_LOG_LIMIT = 200
+
+
+def _bundle_list_sql(entity: str, order_by: str, limit: int | None) -> str:
+    if limit is not None:
+        return (
+            f"(SELECT COALESCE(json_agg(t ORDER BY {order_by}), '[]'::json) FROM "
+            f"(SELECT * FROM {entity} ORDER BY {order_by} LIMIT {int(limit)}) t) AS {entity}"
+        )
+    return f"(SELECT COALESCE(json_agg(t ORDER BY {order_by}), '[]'::json) FROM {entity} t) AS {entity}"
+
+
+# One round trip for the whole dashboard: each table comes back as a JSON value in its
+# own column, ordered the same way as fetch_all() unless board_order puts tasks in board
+# order. Built once per (log_limit, board_order) combination.
+@lru_cache(maxsize=None)
+def _dashboard_bundle_sql(log_limit: int | None, board_order: bool) -> str:
+    order_by = {**_LIST_ORDER_BY, "tasks": _TASKS_ORDER_BY} if board_order else _LIST_ORDER_BY
+    return "SELECT " + ", ".join(
+        [
+            "(SELECT row_to_json(t) FROM project t WHERE id = 1) AS project",
+            "(SELECT row_to_json(t) FROM development_progress t WHERE id = 1) AS development_progress",
+        ]
+        + [
+            _bundle_list_sql(
+                entity,
+                order_by.get(entity, "id DESC"),
+                log_limit if entity == "development_log" else None,
+            )
+            for entity in _BUNDLE_LIST_ENTITIES
+        ]
+    )
 
 
-def entity_or_404(entity: str) -> Dict[str, Any]:
+_FIELD_NAMES = {
+    entity: tuple(field["name"] for field in definition["fields"]) for entity, definition in ENTITY_DEFS.items()
+}
+# Documentation rows also stamp last_updated on every write.
+_WRITE_COLUMNS = {
+    entity: names + ("last_updated",) if entity == "documentation" else names
+    for entity, names in _FIELD_NAMES.items()
+}
+_INSERT_SQL = {
+    entity: f"INSERT INTO {entity} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    for entity, columns in _WRITE_COLUMNS.items()
+}
+_INSERT_MANY_SQL = {
+    entity: f"INSERT INTO {entity} ({', '.join(columns)}) VALUES %s" for entity, columns in _WRITE_COLUMNS.items()
+}
+_UPDATE_SQL = {
+    entity: f"UPDATE {entity} SET {', '.join(f'{column} = %s' for column in columns)} WHERE id = %s"
+    for entity, columns in _WRITE_COLUMNS.items()
+}
+
+
+def fetch_dashboard_bundle(
+    db=None,
+    log_limit: int | None = DASHBOARD_LOG_LIMIT,
+    board_order: bool = True,
+) -> Dict[str, Any]:
+    bundle = fetch_one(_dashboard_bundle_sql(log_limit, board_order), prepare=True, db=db) or {}
+    if bundle.get("project") is None:
+        bundle["project"] = {"name": "", "phase": ""}
+    if bundle.get("development_progress") is None:
+        bundle["development_progress"] = {"percent": None, "phase": "", "status_text": ""}
+    for entity in _BUNDLE_LIST_ENTITIES:
+        if bundle.get(entity) is None:
+            bundle[entity] = []
+    return bundle
+
+
+def entity_or_404(entity: str) -> Mapping[str, Any]:
     if entity not in ENTITY_DEFS or entity == "project":
         abort(404)
     return ENTITY_DEFS[entity]
@@ -46,6 +154,10 @@ def empty_values(fields: List[Dict[str, Any]]) -> Dict[str, str]:
     return {field["name"]: "" for field in fields}
 
 
+_ONLINE_TRUE = frozenset({"1", "true", "yes", "on", "online"})
+_ONLINE_FALSE = frozenset({"0", "false", "no", "off", "offline"})
+
+
 def parse_online_state(value: Any) -> int | None:
     if value is None:
         return None
@@ -53,9 +165,9 @@ def parse_online_state(value: Any) -> int | None:
         return 1 if value else 0
 
     text = str(value).strip().lower()
-    if text in {"1", "true", "yes", "on", "online"}:
+    if text in _ONLINE_TRUE:
         return 1
-    if text in {"0", "false", "no", "off", "offline"}:
+    if text in _ONLINE_FALSE:
         return 0
     return None
 
@@ -63,7 +175,7 @@ def parse_online_state(value: Any) -> int | None:
 def default_values_for(entity: str, fields: List[Dict[str, Any]]) -> Dict[str, str]:
     values = empty_values(fields)
     if entity == "development_log":
-        values["log_date"] = datetime.now().strftime("%Y-%m-%d")
+        values["log_date"] = today_str()
     if entity == "tasks":
         values["priority"] = "Medium"
         values["status"] = "Not started"
@@ -86,10 +198,17 @@ def parse_percent(value: Any) -> float | None:
     return max(0.0, min(100.0, percent))
 
 
+@lru_cache(maxsize=1024)
 def parse_date(value: Any) -> datetime | None:
     if not value:
         return None
     text = str(value).strip()
+    # Dates saved by the forms are ISO; fromisoformat is far cheaper than strptime's format parser.
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d"):
         try:
             return datetime.strptime(text, fmt)
@@ -98,32 +217,43 @@ def parse_date(value: Any) -> datetime | None:
     return None
 
 
+_PRIORITY_CLASS = {"high": "pill-danger", "low": "pill-success"}
+_TASK_STATUS_CLASS = {
+    **dict.fromkeys(("done", "complete", "completed"), "pill-success"),
+    **dict.fromkeys(("in progress", "in-progress", "inprogress"), "pill-info"),
+}
+_BOM_STATUS_CLASS = {
+    **dict.fromkeys(("purchased", "purchase", "bought"), "pill-info"),
+    **dict.fromkeys(
+        ("nonpurchased", "notpurchased", "notyetpurchased", "unpurchased", "notbought"),
+        "pill-danger",
+    ),
+}
+_RISK_STATUS_CLASS = {
+    **dict.fromkeys(("ongoing", "inprogress"), "pill-danger"),
+    "resolved": "pill-success",
+}
+_NO_DUE_DATE = datetime.max
+_PHASE_LOOKUP = {phase.lower(): phase for phase in PHASES}
+_PHASE_NAMES = frozenset(PHASES)
+_STATUS_KEY_STRIP = str.maketrans("", "", " -")
+
+
 def priority_class(value: Any) -> str:
-    text = str(value or "").strip().lower()
-    if text == "high":
-        return "pill-danger"
-    if text == "low":
-        return "pill-success"
-    return "pill-warning"
+    return _PRIORITY_CLASS.get(str(value or "").strip().lower(), "pill-warning")
 
 
 def task_status_class(value: Any) -> str:
-    text = str(value or "").strip().lower()
-    if text in {"done", "complete", "completed"}:
-        return "pill-success"
-    if text in {"in progress", "in-progress", "inprogress"}:
-        return "pill-info"
-    return "pill-muted"
+    return _TASK_STATUS_CLASS.get(str(value or "").strip().lower(), "pill-muted")
 
 
 def normalize_phase(value: Any) -> str:
     if not value:
         return ""
-    text = str(value).strip().lower()
-    for phase in PHASES:
-        if text == phase.lower():
-            return phase
-    return ""
+    # Stored and clicked phases are already canonical; only free text needs folding.
+    if type(value) is str and value in _PHASE_NAMES:
+        return value
+    return _PHASE_LOOKUP.get(str(value).strip().lower(), "")
 
 
 def phase_from_percent(percent: float | None) -> str:
@@ -133,11 +263,10 @@ def phase_from_percent(percent: float | None) -> str:
     return nearest[0]
 
 
-def build_development_view() -> Dict[str, Any]:
-    row = fetch_development_progress()
+def build_development_view(project: Dict[str, Any], row: Dict[str, Any]) -> Dict[str, Any]:
     phase = normalize_phase(row.get("phase"))
     if not phase:
-        project_phase = normalize_phase(fetch_project().get("phase"))
+        project_phase = normalize_phase(project.get("phase"))
         if project_phase:
             phase = project_phase
     percent = parse_percent(row.get("percent"))
@@ -154,14 +283,15 @@ def build_development_view() -> Dict[str, Any]:
     }
 
 
-def build_tasks_view() -> Dict[str, Any]:
+def build_tasks_view(tasks: List[Dict[str, Any]] | None = None) -> Dict[str, Any]:
     today = datetime.now().date()
     week_start = today - timedelta(days=today.weekday())
     days = [week_start + timedelta(days=offset) for offset in range(7)]
     day_map = {day: [] for day in days}
 
-    tasks = fetch_all("tasks")
-    bars: List[Dict[str, Any]] = []
+    if tasks is None:
+        tasks = fetch_all_rows(f"SELECT * FROM tasks ORDER BY {_TASKS_ORDER_BY}", prepare=True)
+    keyed: List[tuple[tuple[int, datetime], Any, Dict[str, Any]]] = []
     for task in tasks:
         due = parse_date(task.get("due_date"))
         due_date = due.date() if due else None
@@ -173,20 +303,17 @@ def build_tasks_view() -> Dict[str, Any]:
             "status_text": status_text,
             "status_class": task_status_class(status_text),
         }
+        rank = _PRIORITY_RANK.get(str(task.get("priority") or "").lower(), _DEFAULT_PRIORITY_RANK)
+        keyed.append(((rank, due or _NO_DUE_DATE), due_date, task_view))
+
+    # One stable sort; the day buckets are filled in sorted order so they need none.
+    keyed.sort(key=itemgetter(0))
+    bars: List[Dict[str, Any]] = []
+    for _, due_date, task_view in keyed:
         bars.append(task_view)
         if due_date in day_map:
             day_map[due_date].append(task_view)
 
-    def sort_key(item: Dict[str, Any]) -> tuple:
-        priority = str(item.get("priority") or "").lower()
-        priority_rank = {"high": 0, "medium": 1, "low": 2}.get(priority, 1)
-        due = parse_date(item.get("due_date")) or datetime.max
-        return (priority_rank, due)
-
-    bars.sort(key=sort_key)
-    for day_tasks in day_map.values():
-        day_tasks.sort(key=sort_key)
-
     day_views = []
     for day in days:
         day_views.append(
@@ -221,63 +348,65 @@ def ordered_card_keys() -> List[str]:
     return pinned + unpinned
 
 
-def build_sections() -> List[Dict[str, Any]]:
+_NON_SECTION_ENTITIES = frozenset({"project", "development_log", "tasks"})
+_SECTION_META = {
+    key: {
+        "title": definition["label"],
+        "fields": list(_FIELD_NAMES[key]),
+        "labels": {field["name"]: field["label"] for field in definition["fields"]},
+    }
+    for key, definition in ENTITY_DEFS.items()
+    if key not in _NON_SECTION_ENTITIES
+}
+
+
+def build_sections(rows_by_entity: Dict[str, List[Dict[str, Any]]] | None = None) -> List[Dict[str, Any]]:
     sections: List[Dict[str, Any]] = []
-    for key, definition in ENTITY_DEFS.items():
-        if key in {"project", "development_log", "tasks"}:
-            continue
-        fields = [field["name"] for field in definition["fields"]]
-        labels = {field["name"]: field["label"] for field in definition["fields"]}
-        rows = fetch_all(key)
+    for key, meta in _SECTION_META.items():
+        rows = rows_by_entity[key] if rows_by_entity is not None else fetch_all(key)
         if key == "system_status":
             rows = rows[:1]
-        sections.append(
-            {
-                "key": key,
-                "title": definition["label"],
-                "fields": fields,
-                "labels": labels,
-                "rows": rows,
-            }
-        )
+        sections.append({"key": key, **meta, "rows": rows})
     return sections
 
 
+@lru_cache(maxsize=1024)
+def _status_key(text: str) -> str:
+    return text.strip().lower().translate(_STATUS_KEY_STRIP)
+
+
+@lru_cache(maxsize=1024)
+def _doc_type_key(text: str) -> str:
+    return text.strip().casefold()
+
+
+# Statuses and doc types come from a small vocabulary, so the folded keys are cached by their text.
 def normalize_status_key(value: Any) -> str:
-    return str(value or "").strip().lower().replace(" ", "").replace("-", "")
+    return _status_key(str(value or ""))
 
 
 def normalize_doc_type_key(value: Any) -> str:
-    return str(value or "").strip().casefold()
+    return _doc_type_key(str(value or ""))
 
 
 def bom_status_class(value: Any) -> str:
-    key = normalize_status_key(value)
-    if key in {"purchased", "purchase", "bought"}:
-        return "pill-info"
-    if key in {"nonpurchased", "notpurchased", "notyetpurchased", "unpurchased", "notbought"}:
-        return "pill-danger"
-    return "pill-muted"
+    return _BOM_STATUS_CLASS.get(normalize_status_key(value), "pill-muted")
 
 
 def risk_status_class(value: Any) -> str:
-    key = normalize_status_key(value)
-    if key in {"ongoing", "inprogress"}:
-        return "pill-danger"
-    if key == "resolved":
-        return "pill-success"
-    return "pill-muted"
+    return _RISK_STATUS_CLASS.get(normalize_status_key(value), "pill-muted")
 
 
 def load_dashboard_data() -> Dict[str, Any]:
+    bundle = fetch_dashboard_bundle()
     return {
-        "project": fetch_project(),
-        "development": build_development_view(),
-        "progress_row": fetch_development_progress(),
-        "logs": fetch_all("development_log"),
-        "tasks": build_tasks_view(),
-        "sections": build_sections(),
-        "updated": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "project": bundle["project"],
+        "development": build_development_view(bundle["project"], bundle["development_progress"]),
+        "progress_row": bundle["development_progress"],
+        "logs": bundle["development_log"],
+        "tasks": build_tasks_view(bundle["tasks"]),
+        "sections": build_sections(bundle),
+        "updated": now_minute_str(),
     }
 
 
@@ -289,7 +418,7 @@ def empty_dashboard_data(error: str = "") -> Dict[str, Any]:
         "logs": [],
         "tasks": {"bars": []},
         "sections": [],
-        "updated": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "updated": now_minute_str(),
         "error": error,
     }
 
@@ -304,17 +433,30 @@ def load_dashboard_data_safe() -> Dict[str, Any]:
     return data
 
 
+def _clean_text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _clean_online(value: Any) -> int:
+    return parse_online_state(value) or 0
+
+
+def _make_sanitizer(names: tuple[str, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    fields = tuple((name, _clean_online if name == "is_online" else _clean_text) for name in names)
+
+    def sanitize(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: clean(payload.get(name, "")) for name, clean in fields}
+
+    return sanitize
+
+
+# One sanitizer per entity, specialized at import so the is_online check is not
+# repeated for every field of every write.
+_SANITIZERS = {entity: _make_sanitizer(names) for entity, names in _FIELD_NAMES.items()}
+
+
 def sanitize_payload(entity: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    definition = ENTITY_DEFS[entity]
-    data: Dict[str, Any] = {}
-    for field in definition["fields"]:
-        name = field["name"]
-        value = payload.get(name, "")
-        if name == "is_online":
-            data[name] = parse_online_state(value) or 0
-        else:
-            data[name] = "" if value is None else str(value).strip()
-    return data
+    return _SANITIZERS[entity](payload)
 
 
 def fetch_current_system_status() -> Dict[str, Any]:
@@ -348,55 +490,86 @@ def upsert_current_system_status(payload: Dict[str, Any]) -> Dict[str, Any]:
     current = fetch_one("SELECT * FROM system_status ORDER BY id DESC LIMIT 1")
     data = sanitize_current_system_status_payload(payload, current)
 
-    if current is None:
-        execute_sql(
-            "INSERT INTO system_status (is_online, reason, estimated_downtime) VALUES (%s, %s, %s)",
-            (data["is_online"], data["reason"], data["estimated_downtime"]),
-        )
-    else:
-        execute_sql(
-            "UPDATE system_status SET is_online = %s, reason = %s, estimated_downtime = %s WHERE id = %s",
-            (data["is_online"], data["reason"], data["estimated_downtime"], current["id"]),
-        )
-
-    get_db().commit()
+    with tx():
+        if current is None:
+            execute_sql(
+                "INSERT INTO system_status (is_online, reason, estimated_downtime) VALUES (%s, %s, %s)",
+                (data["is_online"], data["reason"], data["estimated_downtime"]),
+            )
+        else:
+            execute_sql(
+                "UPDATE system_status SET is_online = %s, reason = %s, estimated_downtime = %s WHERE id = %s",
+                (data["is_online"], data["reason"], data["estimated_downtime"], current["id"]),
+            )
     return fetch_current_system_status()
 
 
 def insert_entity(entity: str, payload: Dict[str, Any]) -> None:
-    data = sanitize_payload(entity, payload)
+    values = list(sanitize_payload(entity, payload).values())
     if entity == "documentation":
-        data["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-    columns = ", ".join(data.keys())
-    placeholders = ", ".join("%s" for _ in data)
-    execute_sql(
-        f"INSERT INTO {entity} ({columns}) VALUES ({placeholders})",
-        list(data.values()),
-    )
-    get_db().commit()
+        values.append(today_str())
+    with tx():
+        execute_sql(_INSERT_SQL[entity], values)
+
+
+def _insert_rows(entity: str, payloads: List[Dict[str, Any]]) -> List[List[Any]]:
+    rows = [list(sanitize_payload(entity, payload).values()) for payload in payloads]
+    if entity == "documentation":
+        today = today_str()
+        for row in rows:
+            row.append(today)
+    return rows
+
+
+def insert_entity_many(entity: str, payloads: List[Dict[str, Any]]) -> int:
+    if not payloads:
+        return 0
+    rows = _insert_rows(entity, payloads)
+    with tx():
+        execute_sql_values(_INSERT_MANY_SQL[entity], rows)
+    return len(rows)
+
+
+# Large imports go through COPY; rows are sanitized exactly like insert_entity_many.
+def copy_insert_entity(entity: str, payloads: List[Dict[str, Any]]) -> int:
+    if not payloads:
+        return 0
+    rows = _insert_rows(entity, payloads)
+    with tx():
+        copy_rows(entity, _WRITE_COLUMNS[entity], rows)
+    return len(rows)
 
 
 def update_entity(entity: str, item_id: int, payload: Dict[str, Any]) -> None:
-    data = sanitize_payload(entity, payload)
+    values = list(sanitize_payload(entity, payload).values())
     if entity == "documentation":
-        data["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-    assignments = ", ".join(f"{key} = %s" for key in data)
-    execute_sql(
-        f"UPDATE {entity} SET {assignments} WHERE id = %s",
-        list(data.values()) + [item_id],
-    )
-    get_db().commit()
+        values.append(today_str())
+    values.append(item_id)
+    with tx():
+        execute_sql(_UPDATE_SQL[entity], values)
 
 
 def delete_entity(entity: str, item_id: int) -> None:
-    execute_sql(f"DELETE FROM {entity} WHERE id = %s", (item_id,))
-    get_db().commit()
+    with tx():
+        execute_sql(f"DELETE FROM {entity} WHERE id = %s", (item_id,))
 
 
 def update_project(payload: Dict[str, Any]) -> None:
     data = sanitize_payload("project", payload)
-    execute_sql("UPDATE project SET name = %s WHERE id = 1", (data.get("name", ""),))
-    get_db().commit()
+    with tx():
+        execute_sql("UPDATE project SET name = %s WHERE id = 1", (data.get("name", ""),))
+
+
+# Upsert the progress row and mirror a non-empty phase onto the project in one statement.
+_UPDATE_PROGRESS_SQL = (
+    "WITH progress AS ("
+    " INSERT INTO development_progress (id, percent, phase, status_text) VALUES (1, %s, %s, '')"
+    " ON CONFLICT (id) DO UPDATE SET percent = EXCLUDED.percent, phase = EXCLUDED.phase,"
+    " status_text = EXCLUDED.status_text"
+    " RETURNING phase"
+    ") "
+    "UPDATE project SET phase = progress.phase FROM progress WHERE project.id = 1 AND progress.phase <> ''"
+)
 
 
 def update_progress(payload: Dict[str, Any]) -> None:
@@ -407,14 +580,5 @@ def update_progress(payload: Dict[str, Any]) -> None:
     if percent is not None and not phase:
         phase = phase_from_percent(percent)
     percent_value = int(round(percent)) if percent is not None else None
-    execute_sql(
-        "INSERT INTO development_progress (id, percent, phase, status_text) VALUES (1, NULL, '', '') "
-        "ON CONFLICT (id) DO NOTHING"
-    )
-    execute_sql(
-        "UPDATE development_progress SET percent = %s, phase = %s, status_text = %s WHERE id = 1",
-        (percent_value, phase, ""),
-    )
-    if phase:
-        execute_sql("UPDATE project SET phase = %s WHERE id = 1", (phase,))
-    get_db().commit()
+    with tx():
+        execute_sql(_UPDATE_PROGRESS_SQL, (percent_value, phase))
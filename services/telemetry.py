@@ -73,6 +73,10 @@ def coerce_float(value: Any) -> float | None:
     return _parse_float_text(match.group(0))
 
 
+_TRUTHY_TEXT = frozenset({"1", "true", "yes", "on", "online", "enabled", "active"})
+_FALSY_TEXT = frozenset({"0", "false", "no", "off", "offline", "disabled", "inactive"})
+
+
 def coerce_bool(value: Any) -> bool | None:
     if value is None:
         return None
@@ -81,9 +85,9 @@ def coerce_bool(value: Any) -> bool | None:
     if isinstance(value, (int, float)):
         return bool(value)
     text = str(value).strip().lower()
-    if text in {"1", "true", "yes", "on", "online", "enabled", "active"}:
+    if text in _TRUTHY_TEXT:
         return True
-    if text in {"0", "false", "no", "off", "offline", "disabled", "inactive"}:
+    if text in _FALSY_TEXT:
         return False
     return None
 
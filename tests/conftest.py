@@ -0,0 +1,8 @@
+import os
+import sys
+from pathlib import Path
+
+# config requires DATABASE_URL at import; point it at a socket that does not exist so db's
+# startup pool attempt fails fast and every test supplies its own fake connection.
+os.environ.setdefault("DATABASE_URL", "dbname=scc_test host=/nonexistent")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
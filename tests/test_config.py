@@ -0,0 +1,14 @@
+import pytest
+
+from config import ENTITY_DEFS
+
+
+def test_entity_defs_are_read_only_all_the_way_down():
+    with pytest.raises(TypeError):
+        ENTITY_DEFS["bom"] = {}
+    with pytest.raises(TypeError):
+        ENTITY_DEFS["bom"]["label"] = "Parts"
+    with pytest.raises(AttributeError):
+        ENTITY_DEFS["bom"]["fields"].append({"name": "notes", "label": "Notes"})
+    with pytest.raises(TypeError):
+        ENTITY_DEFS["bom"]["fields"][0]["name"] = "part"
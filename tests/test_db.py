@@ -0,0 +1,165 @@
+import psycopg2
+import pytest
+from flask import Flask, g
+
+import db
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, params=None):
+        self.connection.statements.append(query)
+        if query.startswith("EXECUTE") and self.connection.stale_plans:
+            self.connection.stale_plans -= 1
+            raise psycopg2.errors.FeatureNotSupported("cached plan must not change result type")
+
+
+class FakeConnection:
+    def __init__(self, autocommit=True, stale_plans=0):
+        self.autocommit = autocommit
+        self.stale_plans = stale_plans
+        self.statements = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+def test_prepared_statement_is_prepared_once_per_connection():
+    connection = FakeConnection()
+    db._execute(connection.cursor(), "SELECT * FROM bom", None, True)
+    db._execute(connection.cursor(), "SELECT * FROM bom", None, True)
+    name, prepare_sql, _ = db._prepared_statement("SELECT * FROM bom")
+    assert connection.statements == [prepare_sql, f"EXECUTE {name}", f"EXECUTE {name}"]
+
+
+def test_changed_result_type_reprepares_and_retries():
+    connection = FakeConnection()
+    db._execute(connection.cursor(), "SELECT * FROM bom", None, True)
+    connection.stale_plans = 1
+    db._execute(connection.cursor(), "SELECT * FROM bom", None, True)
+    name, prepare_sql, _ = db._prepared_statement("SELECT * FROM bom")
+    assert connection.statements[2:] == [f"EXECUTE {name}", f"DEALLOCATE {name}", prepare_sql, f"EXECUTE {name}"]
+    assert db._PREPARED[connection] == {name: True}
+
+
+def test_changed_result_type_in_transaction_reprepares_on_next_use():
+    connection = FakeConnection()
+    db._execute(connection.cursor(), "SELECT * FROM bom WHERE id = %s", (1,), True)
+    connection.autocommit = False
+    connection.stale_plans = 1
+    with pytest.raises(psycopg2.errors.FeatureNotSupported):
+        db._execute(connection.cursor(), "SELECT * FROM bom WHERE id = %s", (1,), True)
+    name, prepare_sql, _ = db._prepared_statement("SELECT * FROM bom WHERE id = %s")
+    assert db._PREPARED[connection] == {name: False}
+
+    connection.autocommit = True
+    db._execute(connection.cursor(), "SELECT * FROM bom WHERE id = %s", (1,), True)
+    assert connection.statements[-3:] == [f"DEALLOCATE {name}", prepare_sql, f"EXECUTE {name} (%s)"]
+
+
+class FakeTxConnection:
+    def __init__(self):
+        self.autocommit = False
+        self.calls = []
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.calls.append("rollback")
+
+
+class FakePool:
+    def __init__(self):
+        self.connection = FakeTxConnection()
+        self.returned = []
+
+    def getconn(self):
+        return self.connection
+
+    def putconn(self, connection):
+        self.returned.append(connection)
+
+
+BUNDLE_LIST_KEYS = ("bom", "documentation", "system_status", "tasks", "risks", "development_log")
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    fake = FakePool()
+    monkeypatch.setattr(db, "DB_POOL", fake)
+    return fake
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.teardown_appcontext(db.close_db)
+    return app
+
+
+def test_first_write_leaves_autocommit_and_marks_request_dirty(app, fake_pool):
+    with app.app_context():
+        connection = db.get_db()
+        assert connection.autocommit is True
+        assert "db_dirty" not in g
+
+        assert db.get_write_db() is connection
+        assert connection.autocommit is False
+        assert g.db_dirty is True
+
+    assert connection.calls == ["rollback"]
+    assert fake_pool.returned == [connection]
+
+
+def test_tx_rolls_back_on_error_without_bumping_version(app, fake_pool):
+    version = db.data_version()
+    with app.app_context():
+        with pytest.raises(RuntimeError):
+            with db.tx():
+                raise RuntimeError("write failed")
+        assert fake_pool.connection.calls == ["rollback"]
+        assert db.data_version() == version
+
+        with db.tx():
+            pass
+        assert fake_pool.connection.calls == ["rollback", "commit"]
+        assert db.data_version() == version + 1
+
+
+def test_read_only_request_is_returned_without_rollback(app, fake_pool):
+    with app.app_context():
+        connection = db.get_db()
+        assert connection.autocommit is True
+
+    assert connection.calls == []
+    assert connection.autocommit is False
+    assert fake_pool.returned == [connection]
+
+
+def test_api_data_cache_is_invalidated_by_commit(app, fake_pool, monkeypatch):
+    from routes import api
+
+    bundles = []
+
+    def fake_bundle(db=None, **kwargs):
+        bundles.append(kwargs)
+        return {key: [] for key in BUNDLE_LIST_KEYS} | {"development_progress": {}, "project": {"name": f"v{len(bundles)}"}}
+
+    monkeypatch.setattr(api, "fetch_dashboard_bundle", fake_bundle)
+    monkeypatch.setattr(api, "_api_data_cache", None)
+    api.register_api_routes(app)
+    client = app.test_client()
+
+    assert client.get("/api/data").get_json()["project"] == {"name": "v1"}
+    assert client.get("/api/data").get_json()["project"] == {"name": "v1"}
+    assert len(bundles) == 1
+
+    with app.app_context():
+        with db.tx():
+            pass
+
+    assert client.get("/api/data").get_json()["project"] == {"name": "v2"}
+    assert len(bundles) == 2
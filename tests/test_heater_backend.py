@@ -0,0 +1,188 @@
+import threading
+
+import pytest
+
+import heater_backend
+
+WAIT_SECONDS = 5
+
+
+class CountingEvent(threading.Event):
+    def __init__(self):
+        super().__init__()
+        self.waiters = 0
+        self.waiters_lock = threading.Lock()
+
+    def wait(self, timeout=None):
+        with self.waiters_lock:
+            self.waiters += 1
+        return super().wait(timeout)
+
+
+class CountingFlight(heater_backend._CommandFlight):
+    def __init__(self):
+        super().__init__()
+        self.done = CountingEvent()
+
+
+def wait_for(predicate):
+    event = threading.Event()
+    for _ in range(WAIT_SECONDS * 100):
+        if predicate():
+            return
+        event.wait(0.01)
+    raise AssertionError("timed out waiting for the relay threads")
+
+
+def run_in_threads(count, target):
+    results = [None] * count
+    errors = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as exc:
+            errors[index] = exc
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+@pytest.fixture
+def flights(monkeypatch):
+    monkeypatch.setattr(heater_backend, "_CommandFlight", CountingFlight)
+    monkeypatch.setattr(heater_backend, "_COMMAND_FLIGHTS", {})
+    return heater_backend._COMMAND_FLIGHTS
+
+
+def start_leader(monkeypatch, flights, upstream):
+    release = threading.Event()
+    calls = []
+
+    def fake_post(url, body):
+        calls.append(body)
+        if len(calls) == 1:
+            release.wait(WAIT_SECONDS)
+        return upstream(len(calls))
+
+    monkeypatch.setattr(heater_backend, "azure_post", fake_post)
+    leader = run_in_threads(1, lambda: heater_backend.relay_command("url", b"shutdown", coalesce=True))
+    wait_for(lambda: b"shutdown" in flights)
+    return leader, release, calls
+
+
+def test_followers_get_the_leaders_result(monkeypatch, flights):
+    (leader, leader_results, _), release, calls = start_leader(
+        monkeypatch, flights, lambda n: (f"reply {n}".encode(), "application/json", 200)
+    )
+    flight = flights[b"shutdown"]
+    followers, results, errors = run_in_threads(
+        3, lambda: heater_backend.relay_command("url", b"shutdown", coalesce=True)
+    )
+    wait_for(lambda: flight.done.waiters == 3)
+    release.set()
+    for thread in leader + followers:
+        thread.join(WAIT_SECONDS)
+
+    assert calls == [b"shutdown"]
+    assert leader_results == [(b"reply 1", "application/json", 200)]
+    assert results == [(b"reply 1", "application/json", 200)] * 3
+    assert errors == [None] * 3
+    assert flights == {}
+
+
+def test_leader_failure_lets_followers_make_their_own_call(monkeypatch, flights):
+    def upstream(n):
+        if n == 1:
+            raise ConnectionError("relay down")
+        return (b"ok", "application/json", 200)
+
+    (leader, _, leader_errors), release, calls = start_leader(monkeypatch, flights, upstream)
+    flight = flights[b"shutdown"]
+    followers, results, errors = run_in_threads(
+        2, lambda: heater_backend.relay_command("url", b"shutdown", coalesce=True)
+    )
+    wait_for(lambda: flight.done.waiters == 2)
+    release.set()
+    for thread in leader + followers:
+        thread.join(WAIT_SECONDS)
+
+    assert isinstance(leader_errors[0], ConnectionError)
+    assert len(calls) == 3
+    assert results == [(b"ok", "application/json", 200)] * 2
+    assert errors == [None] * 2
+    assert flights == {}
+
+
+def test_non_idempotent_commands_are_never_coalesced(monkeypatch, flights):
+    calls = []
+
+    def fake_post(url, body):
+        calls.append(body)
+        return (b"ok", "application/json", 200)
+
+    monkeypatch.setattr(heater_backend, "azure_post", fake_post)
+    flights[b"pulse"] = CountingFlight()
+
+    assert heater_backend.relay_command("url", b"pulse") == (b"ok", "application/json", 200)
+    assert heater_backend.relay_command("url", b"pulse") == (b"ok", "application/json", 200)
+    assert calls == [b"pulse", b"pulse"]
+    assert flights[b"pulse"].done.waiters == 0
+
+
+@pytest.fixture
+def telemetry(monkeypatch):
+    clock = [100.0]
+    calls = []
+
+    def fake_get(url):
+        calls.append(url)
+        return (f"reading {len(calls)}".encode(), "application/json", 200)
+
+    monkeypatch.setattr(heater_backend, "_TELEMETRY_CACHE", None)
+    monkeypatch.setattr(heater_backend, "TELEMETRY_TTL_SECONDS", 0.5)
+    monkeypatch.setattr(heater_backend.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(heater_backend, "azure_get", fake_get)
+    return clock, calls
+
+
+def test_telemetry_is_cached_until_the_ttl_expires(telemetry):
+    clock, calls = telemetry
+
+    assert heater_backend.relay_telemetry("url")[0] == b"reading 1"
+    clock[0] += 0.49
+    assert heater_backend.relay_telemetry("url")[0] == b"reading 1"
+    clock[0] += 0.01
+    assert heater_backend.relay_telemetry("url")[0] == b"reading 2"
+    assert len(calls) == 2
+
+
+def test_concurrent_pollers_share_one_telemetry_fetch(telemetry, monkeypatch):
+    _, calls = telemetry
+    release = threading.Event()
+    fake_get = heater_backend.azure_get
+
+    def slow_get(url):
+        release.wait(WAIT_SECONDS)
+        return fake_get(url)
+
+    monkeypatch.setattr(heater_backend, "azure_get", slow_get)
+    threads, results, errors = run_in_threads(4, lambda: heater_backend.relay_telemetry("url"))
+    release.set()
+    for thread in threads:
+        thread.join(WAIT_SECONDS)
+
+    assert calls == ["url"]
+    assert results == [(b"reading 1", "application/json", 200)] * 4
+    assert errors == [None] * 4
+
+
+def test_zero_ttl_disables_the_telemetry_cache(telemetry, monkeypatch):
+    _, calls = telemetry
+    monkeypatch.setattr(heater_backend, "TELEMETRY_TTL_SECONDS", 0)
+
+    heater_backend.relay_telemetry("url")
+    heater_backend.relay_telemetry("url")
+    assert len(calls) == 2
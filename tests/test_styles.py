@@ -0,0 +1,20 @@
+from ui.styles import GLASS_CSS_CRITICAL, GLASS_CSS_DEFERRED
+
+
+def assert_balanced(css: str) -> None:
+    depth = 0
+    for char in css:
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            assert depth >= 0, "closing brace without a matching opening brace"
+    assert depth == 0, f"{depth} unclosed block(s)"
+
+
+def test_critical_css_braces_balanced():
+    assert_balanced(GLASS_CSS_CRITICAL)
+
+
+def test_deferred_css_braces_balanced():
+    assert_balanced(GLASS_CSS_DEFERRED)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+from functools import lru_cache
 from typing import Any, Callable, Dict, List
 
 from flask import current_app, has_app_context
 from reactpy import component, event, hooks, html
 
-from config import DOC_TYPE_FILTER_ALL, ENTITY_DEFS, PHASES, PHASE_TO_PERCENT
+from config import ENTITY_DEFS, PHASES, PHASE_TO_PERCENT
 from services.heater_telemetry_source import load_heater_telemetry_safe, send_heater_command
 from services.blob_export import export_broadcast_csv_to_blob
 from services.dashboard import (
@@ -16,7 +18,6 @@ from services.dashboard import (
     delete_entity,
     insert_entity,
     load_dashboard_data_safe,
-    normalize_doc_type_key,
     normalize_phase,
     risk_status_class,
     update_entity,
@@ -27,7 +28,7 @@ from services.iot_hub import get_device_twin, iot_hub_status_summary, patch_devi
 from services.iot_hub_telemetry import iot_hub_telemetry_status_summary
 from services.pacific_time import format_pacific_timestamp
 from services.telemetry import coerce_float, telemetry_log_sample_count
-from ui.styles import GLASS_CSS
+from ui.styles import GLASS_CSS_CRITICAL_MIN, GLASS_CSS_URL
 
 
 def _logger() -> logging.Logger:
@@ -38,6 +39,11 @@ def _logger() -> logging.Logger:
 
 BLOB_UPLOAD_SCRIPT = """
 (function () {
+  if (window.__blobUploadInstalled) {
+    return;
+  }
+  window.__blobUploadInstalled = true;
+
   function getDropZone() {
     return document.getElementById("blob-upload-zone");
   }
@@ -143,7 +149,121 @@ BLOB_UPLOAD_SCRIPT = """
 })();
 """
 
+# Head scripts can be evaluated again after a reconnect; the window flags keep one listener set.
+UNSAVED_CHANGES_SCRIPT = """
+(function () {
+  if (window.__hubBeforeUnloadInstalled) {
+    return;
+  }
+  window.__hubBeforeUnloadInstalled = true;
+  var root = null;
+
+  window.addEventListener("beforeunload", function (event) {
+    // The root is replaced when the layout remounts, so only re-query once it is detached.
+    if (!root || !root.isConnected) {
+      root = document.getElementById("project-hub-root");
+    }
+    if (!root || root.getAttribute("data-unsaved") !== "1") {
+      return;
+    }
+    event.preventDefault();
+    event.returnValue = "";
+  });
+})();
+"""
+
+STYLESHEET_LOADER_SCRIPT = """
+(function () {
+  var href = __GLASS_CSS_URL__;
+  if (window.__glassSheet) {
+    return;
+  }
+
+  function useLink() {
+    var link = document.createElement("link");
+    link.rel = "stylesheet";
+    link.href = href;
+    document.head.appendChild(link);
+  }
+
+  if (!("adoptedStyleSheets" in Document.prototype) || !("replaceSync" in CSSStyleSheet.prototype)) {
+    useLink();
+    return;
+  }
+
+  fetch(href)
+    .then(function (response) {
+      if (!response.ok) {
+        throw new Error("stylesheet " + response.status);
+      }
+      return response.text();
+    })
+    .then(function (css) {
+      var sheet = new CSSStyleSheet();
+      sheet.replaceSync(css);
+      window.__glassSheet = sheet;
+      document.adoptedStyleSheets = document.adoptedStyleSheets.concat([sheet]);
+    })
+    .catch(useLink);
+})();
+""".replace("__GLASS_CSS_URL__", json.dumps(GLASS_CSS_URL))
+
+# Attribute dicts repeated across the page. vdom() copies attributes but pops "key" from the dict it
+# is given, so only key-less dicts are shared.
+_META_ATTRS = {"class": "meta"}
+_STAT_LABEL_ATTRS = {"class": "stat-label"}
+_STAT_VALUE_ATTRS = {"class": "stat-value"}
+_STAT_BOX_ATTRS = {"class": "stat-box glass-surface glass-panel"}
+_STATUS_INFO_ATTRS = {"class": "status-info glass-surface glass-panel"}
+_SECTION_HEADER_ATTRS = {"class": "section-header"}
+_BUTTON_GROUP_ATTRS = {"class": "button-group"}
+_FORM_ACTIONS_ATTRS = {"class": "form-actions"}
+_FIELD_ATTRS = {"class": "field"}
+_CARD_ATTRS = {"class": "card glass-surface glass-card"}
+
+# Static subtrees shared by every render; the upload zone is driven entirely by BLOB_UPLOAD_SCRIPT.
+BLOB_UPLOAD_ZONE = html.div(
+    {
+        "id": "blob-upload-zone",
+        "class": "blob-upload-zone glass-surface glass-panel",
+        "role": "button",
+        "tabIndex": "0",
+        "data-upload-state": "idle",
+    },
+    html.input(
+        {
+            "id": "blob-upload-input",
+            "type": "file",
+            "style": {"display": "none"},
+        }
+    ),
+    html.div({"class": "blob-upload-title", "data-upload-label": "1"}, "Drop a file here or click to upload to Blob"),
+    html.p(
+        _META_ATTRS,
+        "The file is uploaded to Azure Blob Storage and added to Documentation automatically.",
+    ),
+)
+PHASE_SECTION_HEADER = html.div(
+    _SECTION_HEADER_ATTRS,
+    html.h2("Development Phase"),
+    html.p(_META_ATTRS, "Click a phase to save immediately"),
+)
+UNSAVED_CHANGES_PROMPT = html.p("You have unsaved changes. Discard them?")
+ERROR_STATE_TITLE = html.h1("Dashboard Error")
+# Empty states are returned as the same node every time so the diff ends at the identity check.
+EMPTY_SECTION_STATE = html.p(_META_ATTRS, "No items yet.")
+EMPTY_TASKS_STATE = html.p(_META_ATTRS, "No tasks yet.")
+EMPTY_LINK_CELL = html.span(_META_ATTRS, "No link")
+EMPTY_OTA_ARTIFACT = html.p(_META_ATTRS, "No OTA artifact queued yet.")
+
 TELEMETRY_POLL_SECONDS = 3.0
+# Keystrokes landing within one frame share a single re-render.
+FORM_RENDER_COALESCE_SECONDS = 0.016
+# Long tables and the task list render this many entries until the user asks for the rest.
+LIST_RENDER_WINDOW = 50
+# Progress bar widths only take the per-phase values, so each phase shares one style dict.
+_PHASE_WIDTH_STYLES = {phase: {"width": f"{percent}%"} for phase, percent in PHASE_TO_PERCENT.items()}
+_ZERO_WIDTH_STYLE = {"width": "0%"}
 
 
 APP_HEAD = (
@@ -152,18 +272,21 @@ APP_HEAD = (
         "tagName": "meta",
         "attributes": {"name": "viewport", "content": "width=device-width, initial-scale=1"},
     },
+    {
+        "tagName": "style",
+        "children": [GLASS_CSS_CRITICAL_MIN],
+    },
+    {
+        "tagName": "script",
+        "children": [STYLESHEET_LOADER_SCRIPT],
+    },
+    {
+        "tagName": "noscript",
+        "children": [{"tagName": "link", "attributes": {"rel": "stylesheet", "href": GLASS_CSS_URL}}],
+    },
     {
         "tagName": "script",
-        "children": [
-            "window.addEventListener('beforeunload', function (event) {"
-            "  var root = document.getElementById('project-hub-root');"
-            "  if (!root || root.getAttribute('data-unsaved') !== '1') {"
-            "    return;"
-            "  }"
-            "  event.preventDefault();"
-            "  event.returnValue = '';"
-            "});"
-        ],
+        "children": [UNSAVED_CHANGES_SCRIPT],
     },
     {
         "tagName": "script",
@@ -172,6 +295,142 @@ APP_HEAD = (
 )
 
 
+ONLINE_OPTIONS = (
+    {"label": "Online", "value": "1"},
+    {"label": "Offline", "value": "0"},
+)
+PRIORITY_OPTIONS = (
+    {"label": "High", "value": "High"},
+    {"label": "Medium", "value": "Medium"},
+    {"label": "Low", "value": "Low"},
+)
+WORK_STATUS_OPTIONS = (
+    {"label": "Not started", "value": "Not started"},
+    {"label": "In progress", "value": "In progress"},
+    {"label": "Done", "value": "Done"},
+)
+RISK_STATUS_OPTIONS = (
+    {"label": "Ongoing", "value": "Ongoing"},
+    {"label": "Resolved", "value": "Resolved"},
+)
+BOM_STATUS_OPTIONS = (
+    {"label": "Not yet purchased", "value": "Not yet purchased"},
+    {"label": "Purchased", "value": "Purchased"},
+)
+PHASE_OPTIONS = tuple({"label": phase, "value": phase} for phase in PHASES)
+
+# (entity, field) pairs rendered as segmented buttons, with their options.
+_SEG_SPEC: Dict[tuple[str, str], tuple[Dict[str, str], ...]] = {
+    ("system_status", "is_online"): ONLINE_OPTIONS,
+    ("tasks", "priority"): PRIORITY_OPTIONS,
+    ("tasks", "status"): WORK_STATUS_OPTIONS,
+    ("documentation", "status"): WORK_STATUS_OPTIONS,
+    ("risks", "status"): RISK_STATUS_OPTIONS,
+    ("bom", "status"): BOM_STATUS_OPTIONS,
+}
+_SEGMENTED_FIELDS = frozenset(_SEG_SPEC)
+_FORM_TAGS = frozenset({"INPUT", "TEXTAREA", "SELECT"})
+
+
+def _entity_form_spec(entity: str, entity_def: Dict[str, Any]) -> Dict[str, Any]:
+    fields = tuple(entity_def.get("fields", []))
+    label = entity_def.get("label", entity)
+    return {
+        "fields": fields,
+        "add_title": f"Add {label}",
+        "edit_title": f"Edit {label}",
+        # Text controls in submit order; segmented fields render as buttons, not inputs.
+        "input_names": tuple(
+            str(field.get("name") or "")
+            for field in fields
+            if field.get("name") and (entity, field.get("name")) not in _SEGMENTED_FIELDS
+        ),
+    }
+
+
+# ENTITY_DEFS is static, so each modal's field list, titles and submit order are built once.
+_ENTITY_FORMS = {entity: _entity_form_spec(entity, entity_def) for entity, entity_def in ENTITY_DEFS.items()}
+_EMPTY_FORM = _entity_form_spec("", {})
+_PROGRESS_INPUT_NAMES = ("percent", "phase")
+
+
+def _entity_table_spec(entity_def: Dict[str, Any]) -> Dict[str, Any]:
+    fields = entity_def.get("fields", [])
+    field_names = tuple(f["name"] for f in fields)
+    field_labels = {f["name"]: f["label"] for f in fields}
+    return {
+        "field_names": field_names,
+        "thead": html.thead(
+            html.tr(
+                *[html.th(field_labels.get(name, name)) for name in field_names],
+                html.th("Actions"),
+            )
+        ),
+    }
+
+
+# Table columns and header rows come straight from ENTITY_DEFS, so every render shares them.
+_ENTITY_TABLES = {entity: _entity_table_spec(entity_def) for entity, entity_def in ENTITY_DEFS.items()}
+_EMPTY_TABLE = _entity_table_spec({})
+
+
+@lru_cache(maxsize=256)
+def field_label(label: str) -> Dict:
+    # Labels never change between renders, so every form shares one node per label.
+    return html.label({"class": "label"}, label)
+
+
+def _documentation_title_cell(value: Any, row: Dict[str, Any]) -> Any:
+    text_value = "" if value is None else str(value)
+    if row.get("location") and row.get("id"):
+        return html.a(
+            {"class": "link documentation-link", "href": f"/api/documentation/{int(row['id'])}/blob"},
+            text_value or "Blob",
+        )
+    return text_value
+
+
+def _external_link_cell(value: Any, row: Dict[str, Any]) -> Dict:
+    if value:
+        return html.a(
+            {"class": "link", "href": str(value), "target": "_blank", "rel": "noopener"},
+            "Open",
+        )
+    return EMPTY_LINK_CELL
+
+
+# Every status helper returns one of these tones, so the full class attribute is looked up, not formatted.
+_PILL_CLASS_ATTRS = {
+    tone: f"pill {tone}" for tone in ("pill-success", "pill-info", "pill-warning", "pill-danger", "pill-muted")
+}
+_TASK_PRIORITY_PILLS = {"High": "pill priority-high", "Medium": "pill priority-medium", "Low": "pill priority-low"}
+_TASK_STATUS_PILLS = {"Not started": "pill status-", "In progress": "pill status-in-progress", "Done": "pill status-done"}
+
+
+def _pill_class_attr(tone: str) -> str:
+    return _PILL_CLASS_ATTRS.get(tone) or f"pill {tone}"
+
+
+def _status_pill_cell(
+    status_class: Callable[[Any], str],
+    options: tuple[Dict[str, str], ...],
+) -> Callable[[Any, Dict[str, Any]], Dict]:
+    # Pills for the statuses the forms offer are built once; free-text values are built per cell.
+    known = {option["value"]: html.span({"class": _pill_class_attr(status_class(option["value"]))}, option["value"]) for option in options}
+
+    def render(value: Any, row: Dict[str, Any]) -> Dict:
+        pill = known.get(value) if type(value) is str else None
+        if pill is not None:
+            return pill
+        return html.span({"class": _pill_class_attr(status_class(value))}, str(value or ""))
+    return render
+
+
+_ONLINE_TRUE = frozenset({"1", "true", "yes", "on", "online"})
+_ONLINE_FALSE = frozenset({"0", "false", "no", "off", "offline"})
+_ENTITY_MODAL_TYPES = frozenset({"new_entity", "edit_entity"})
+
+
 def parse_online_state(value: Any) -> bool | None:
     if value is None:
         return None
@@ -184,9 +443,9 @@ def parse_online_state(value: Any) -> bool | None:
             return False
 
     text = str(value).strip().lower()
-    if text in {"1", "true", "yes", "on", "online"}:
+    if text in _ONLINE_TRUE:
         return True
-    if text in {"0", "false", "no", "off", "offline"}:
+    if text in _ONLINE_FALSE:
         return False
     return None
 
@@ -241,6 +500,46 @@ def documentation_status_class(value: Any) -> str:
     return "pill-muted"
 
 
+# Table cells that render as something other than plain text, keyed by (entity, field).
+CELL_RENDERERS: Dict[tuple[str, str], Callable[[Any, Dict[str, Any]], Any]] = {
+    ("documentation", "title"): _documentation_title_cell,
+    ("documentation", "location"): _external_link_cell,
+    ("documentation", "status"): _status_pill_cell(documentation_status_class, WORK_STATUS_OPTIONS),
+    ("bom", "link"): _external_link_cell,
+    ("bom", "status"): _status_pill_cell(bom_status_class, BOM_STATUS_OPTIONS),
+    ("risks", "status"): _status_pill_cell(risk_status_class, RISK_STATUS_OPTIONS),
+}
+
+
+def render_table_cell(entity: str, name: str, row: Dict[str, Any]) -> Any:
+    value = row.get(name, "")
+    renderer = CELL_RENDERERS.get((entity, name))
+    if renderer is not None:
+        return renderer(value, row)
+    return "" if value is None else str(value)
+
+
+def row_key(entity: str, row: Dict[str, Any], index: int) -> str:
+    # Entity-qualified string keys stay stable across sections and never collide with index fallbacks.
+    row_id = row.get("id")
+    return f"{entity}:{row_id}" if row_id is not None else f"{entity}:#{index}"
+
+
+def render_task_summary(item: Dict[str, Any]) -> tuple[Dict, Dict]:
+    return (
+        html.div(
+            {"class": "item-header"},
+            html.h4(item.get("task") or "Task"),
+            html.div(
+                {"class": "item-badges"},
+                html.span({"class": _TASK_PRIORITY_PILLS.get(item.get("priority"), "pill priority-")}, item.get("priority") or ""),
+                html.span({"class": _TASK_STATUS_PILLS.get(item.get("status"), "pill status-")}, item.get("status") or ""),
+            ),
+        ),
+        html.p(_META_ATTRS, f"Due: {item.get('due_date') or 'TBD'}"),
+    )
+
+
 def empty_telemetry_state() -> Dict[str, Any]:
     return {
         "temperature": None,
@@ -366,17 +665,28 @@ def App():
         "item_id": None,
         "item_data": None,
     })
-    form_values, set_form_values = hooks.use_state({})
+    # The open form lives in a mutable dict; bumping the version is what re-renders.
+    form_values_ref = hooks.use_ref({})
+    _form_version, set_form_version = hooks.use_state(0)
+    form_render_scheduled_ref = hooks.use_ref(False)
     form_dirty, set_form_dirty = hooks.use_state(False)
     is_busy, set_is_busy = hooks.use_state(False)
+    expanded_lists, set_expanded_lists = hooks.use_state(frozenset)
     control_feedback, set_control_feedback = hooks.use_state("")
-    doc_type_filter, set_doc_type_filter = hooks.use_state(DOC_TYPE_FILTER_ALL)
     busy_ref = hooks.use_ref(False)
     field_event_ts_ref = hooks.use_ref({})
     submit_intent_ref = hooks.use_ref(False)
+    # Field and phase handlers are created once per key and call through to this render's closures.
+    latest_actions_ref = hooks.use_ref({})
+    handler_cache_ref = hooks.use_ref({})
+    section_cache_ref = hooks.use_ref({})
 
     def get_field_value(name: str, default: Any = "") -> Any:
-        return form_values.get(name, default)
+        return form_values_ref.current.get(name, default)
+
+    def set_form_values(values: Dict[str, Any]) -> None:
+        form_values_ref.current = dict(values)
+        set_form_version(lambda version: version + 1)
 
     def refresh_dashboard() -> None:
         set_data(load_dashboard_data_safe())
@@ -408,10 +718,27 @@ def App():
             set_ota_form_values(ota_form_defaults(next_snapshot.get("twin")))
         return next_snapshot
 
-    def set_field(name: str, value: Any) -> None:
+    def bump_form_version() -> None:
+        form_render_scheduled_ref.current = False
+        set_form_version(lambda version: version + 1)
+
+    def schedule_form_render() -> None:
+        if form_render_scheduled_ref.current:
+            return
+        form_render_scheduled_ref.current = True
+        try:
+            asyncio.get_running_loop().call_later(FORM_RENDER_COALESCE_SECONDS, bump_form_version)
+        except RuntimeError:
+            bump_form_version()
+
+    def set_field(name: str, value: Any, coalesce: bool = False) -> None:
         if busy_ref.current:
             return
-        set_form_values(lambda prev: {**prev, name: value})
+        form_values_ref.current[name] = value
+        if coalesce:
+            schedule_form_render()
+        else:
+            set_form_version(lambda version: version + 1)
         if modal_state.get("open"):
             set_form_dirty(True)
 
@@ -423,64 +750,47 @@ def App():
         if ts_raw is None:
             ts_raw = event_data.get("timestamp")
         if ts_raw is not None:
-            try:
-                ts = float(ts_raw)
-            except (TypeError, ValueError):
-                ts = None
+            # JS event timestamps arrive as JSON numbers; only strings need parsing.
+            if type(ts_raw) is int or type(ts_raw) is float:
+                ts = ts_raw
             else:
+                try:
+                    ts = float(ts_raw)
+                except (TypeError, ValueError):
+                    ts = None
+            if ts is not None:
                 last_ts = field_event_ts_ref.current.get(name, -1.0)
                 if ts <= last_ts:
                     return
                 field_event_ts_ref.current[name] = ts
 
         target = event_data.get("target", {})
-        set_field(name, target.get("value", ""))
-
-    def is_segmented_field(entity: str, name: str) -> bool:
-        return (
-            (entity == "system_status" and name == "is_online")
-            or (entity == "tasks" and name in {"priority", "status"})
-            or (entity == "documentation" and name == "status")
-            or (entity == "risks" and name == "status")
-            or (entity == "bom" and name == "status")
-        )
+        set_field(name, target.get("value", ""), coalesce=True)
 
     def submitted_form_values(event_data: Dict[str, Any]) -> Dict[str, Any]:
-        values = dict(form_values)
+        values = dict(form_values_ref.current)
         target = event_data.get("currentTarget") or event_data.get("target") or {}
         elements = target.get("elements") or []
-        controls: List[Dict[str, Any]] = []
-        for element in elements:
-            if not isinstance(element, dict):
-                continue
-            tag = str(element.get("tagName") or "").upper()
-            if tag in {"INPUT", "TEXTAREA", "SELECT"}:
-                controls.append(element)
 
         modal_type = str(modal_state.get("type") or "")
-        entity = ""
         if modal_type == "edit_project":
-            entity = "project"
-            fields = ENTITY_DEFS["project"]["fields"]
+            input_field_names = _ENTITY_FORMS["project"]["input_names"]
         elif modal_type == "edit_progress":
-            fields = [{"name": "percent"}, {"name": "phase"}]
+            input_field_names = _PROGRESS_INPUT_NAMES
         elif modal_type in {"new_entity", "edit_entity"}:
-            entity = str(modal_state.get("entity") or "")
-            fields = ENTITY_DEFS.get(entity, {}).get("fields", [])
+            input_field_names = _ENTITY_FORMS.get(str(modal_state.get("entity") or ""), _EMPTY_FORM)["input_names"]
         else:
-            fields = []
+            input_field_names = ()
 
-        input_field_names: List[str] = []
-        for field in fields:
-            name = str(field.get("name") or "")
-            if not name:
-                continue
-            if entity and is_segmented_field(entity, name):
+        # Text controls arrive in field order; pair them with the input fields as they are seen.
+        names = iter(input_field_names)
+        for element in elements:
+            if type(element) is not dict or str(element.get("tagName") or "").upper() not in _FORM_TAGS:
                 continue
-            input_field_names.append(name)
-
-        for name, control in zip(input_field_names, controls):
-            value = control.get("value", "")
+            name = next(names, None)
+            if name is None:
+                break
+            value = element.get("value", "")
             values[name] = "" if value is None else str(value)
         return values
 
@@ -622,6 +932,9 @@ def App():
             }
         )
 
+    def expand_list(key: str) -> None:
+        set_expanded_lists(lambda current: current | {key})
+
     def handle_delete_entity() -> None:
         def do_delete() -> None:
             entity = modal_state.get("entity")
@@ -729,6 +1042,99 @@ def App():
 
         run_mutation(do_export)
 
+    def index_rows_by_id() -> Dict[str, Dict[str, Dict[str, Any]]]:
+        # Row buttons carry the row id, so a click resolves the row it was rendered for even if
+        # a refresh reordered the list in between; rows without an id are not addressable.
+        lists = {
+            "tasks": data.get("tasks", {}).get("bars", []),
+            **{section["key"]: section.get("rows") or [] for section in data.get("sections", [])},
+        }
+        return {
+            entity: {str(row["id"]): row for row in rows if row.get("id") is not None}
+            for entity, rows in lists.items()
+        }
+
+    rows_by_id = hooks.use_memo(index_rows_by_id, [data])
+
+    latest_actions_ref.current = {
+        "set_field": set_field,
+        "set_field_from_event": set_field_from_event,
+        "run_mutation": run_mutation,
+        "open_entity_modal": open_entity_modal,
+        "open_delete_modal": open_delete_modal,
+        "open_project_modal": open_project_modal,
+        "close_modal": close_modal,
+        "confirm_close": confirm_close,
+        "dismiss_close_warning": dismiss_close_warning,
+        "request_submit": request_submit,
+        "handle_delete_entity": handle_delete_entity,
+        "refresh_telemetry_data": refresh_telemetry_data,
+        "send_heater_command_action": send_heater_command_action,
+        "refresh_iot_hub_data": refresh_iot_hub_data,
+        "push_ota_target_action": push_ota_target_action,
+        "export_broadcast_csv_action": export_broadcast_csv_action,
+        "expand_list": expand_list,
+        "refresh_dashboard": refresh_dashboard,
+        "rows_by_id": rows_by_id,
+    }
+
+    def change_handler(name: str) -> Callable[[Dict[str, Any]], None]:
+        key = ("change", name)
+        handler = handler_cache_ref.current.get(key)
+        if handler is None:
+            def handler(event_data: Dict[str, Any]) -> None:
+                latest_actions_ref.current["set_field_from_event"](name, event_data)
+            handler_cache_ref.current[key] = handler
+        return handler
+
+    def choice_handler(name: str, value: Any) -> Callable[[Dict[str, Any]], None]:
+        key = ("choice", name, value)
+        handler = handler_cache_ref.current.get(key)
+        if handler is None:
+            def handler(event_data: Dict[str, Any]) -> None:
+                latest_actions_ref.current["set_field"](name, value)
+            handler_cache_ref.current[key] = handler
+        return handler
+
+    def phase_handler(phase: str) -> Callable[[Dict[str, Any]], None]:
+        key = ("phase", phase)
+        handler = handler_cache_ref.current.get(key)
+        if handler is None:
+            def handler(event_data: Dict[str, Any]) -> None:
+                latest_actions_ref.current["run_mutation"](
+                    lambda: update_progress({"phase": phase, "percent": PHASE_TO_PERCENT.get(phase, 0)})
+                )
+            handler_cache_ref.current[key] = handler
+        return handler
+
+    def action_handler(action: str, *args: Any) -> Callable[[Dict[str, Any]], None]:
+        # Button handlers that ignore the event: one per (action, args) for the component's lifetime.
+        key = ("action", action, args)
+        handler = handler_cache_ref.current.get(key)
+        if handler is None:
+            def handler(event_data: Dict[str, Any]) -> None:
+                latest_actions_ref.current[action](*args)
+            handler_cache_ref.current[key] = handler
+        return handler
+
+    def row_action_handler(entity: str, action: str) -> Callable[[Dict[str, Any]], None]:
+        # One handler per (entity, action); the clicked button carries its row id as its value.
+        key = ("row", entity, action)
+        handler = handler_cache_ref.current.get(key)
+        if handler is None:
+            def handler(event_data: Dict[str, Any]) -> None:
+                latest = latest_actions_ref.current
+                target = event_data.get("currentTarget") or event_data.get("target") or {}
+                row = latest["rows_by_id"].get(entity, {}).get(str(target.get("value") or ""))
+                if row is None:
+                    return
+                if action == "edit":
+                    latest["open_entity_modal"](entity, "edit", row)
+                else:
+                    latest["open_delete_modal"](entity, row.get("id"))
+            handler_cache_ref.current[key] = handler
+        return handler
+
     def render_button(label: str, **kwargs) -> Dict:
         class_name = kwargs.pop("class", kwargs.pop("class_", "btn glass-btn"))
         return html.button(
@@ -743,8 +1149,8 @@ def App():
 
     def render_input_field(name: str, label: str, input_type: str = "text", **extra_attrs) -> Dict:
         return html.div(
-            {"class": "field"},
-            html.label({"class": "label"}, label),
+            _FIELD_ATTRS,
+            field_label(label),
             html.input(
                 {
                     "name": name,
@@ -752,8 +1158,7 @@ def App():
                     "class": "input glass-input",
                     "default_value": get_field_value(name, ""),
                     "disabled": is_busy,
-                    "on_change": lambda event_data: set_field_from_event(name, event_data),
-                    "on_blur": lambda event_data: set_field_from_event(name, event_data),
+                    "on_change": change_handler(name),
                     **{key: value for key, value in extra_attrs.items() if value is not None},
                 }
             ),
@@ -761,26 +1166,25 @@ def App():
 
     def render_textarea_field(name: str, label: str, **extra_attrs) -> Dict:
         return html.div(
-            {"class": "field"},
-            html.label({"class": "label"}, label),
+            _FIELD_ATTRS,
+            field_label(label),
             html.textarea(
                 {
                     "name": name,
                     "class": "textarea glass-input",
                     "default_value": get_field_value(name, ""),
                     "disabled": is_busy,
-                    "on_change": lambda event_data: set_field_from_event(name, event_data),
-                    "on_blur": lambda event_data: set_field_from_event(name, event_data),
+                    "on_change": change_handler(name),
                     **{key: value for key, value in extra_attrs.items() if value is not None},
                 }
             ),
         )
 
-    def render_segmented_field(name: str, label: str, options: List[Dict[str, str]]) -> Dict:
+    def render_segmented_field(name: str, label: str, options: tuple[Dict[str, str], ...]) -> Dict:
         current_val = get_field_value(name, options[0]["value"] if options else "")
         return html.div(
-            {"class": "field"},
-            html.label({"class": "label"}, label),
+            _FIELD_ATTRS,
+            field_label(label),
             html.div(
                 {"class": "segmented"},
                 *[
@@ -789,7 +1193,7 @@ def App():
                             "type": "button",
                             "class": f"seg-btn {'active' if current_val == opt['value'] else ''}",
                             "disabled": is_busy,
-                            "on_click": lambda e, val=opt["value"]: set_field(name, val),
+                            "on_click": choice_handler(name, opt["value"]),
                         },
                         opt["label"],
                     )
@@ -804,8 +1208,8 @@ def App():
         except (TypeError, ValueError):
             current = min_val
         return html.div(
-            {"class": "field"},
-            html.label({"class": "label"}, label),
+            _FIELD_ATTRS,
+            field_label(label),
             html.div(
                 {"class": "stepper"},
                 render_button(
@@ -827,39 +1231,9 @@ def App():
     def render_generic_field(entity: str, field: Dict[str, Any]) -> Dict:
         name = field["name"]
         label = field["label"]
-        if entity == "system_status" and name == "is_online":
-            return render_segmented_field(name, label, [
-                {"label": "Online", "value": "1"},
-                {"label": "Offline", "value": "0"},
-            ])
-        elif entity == "tasks" and name == "priority":
-            return render_segmented_field(name, label, [
-                {"label": "High", "value": "High"},
-                {"label": "Medium", "value": "Medium"},
-                {"label": "Low", "value": "Low"},
-            ])
-        elif entity == "tasks" and name == "status":
-            return render_segmented_field(name, label, [
-                {"label": "Not started", "value": "Not started"},
-                {"label": "In progress", "value": "In progress"},
-                {"label": "Done", "value": "Done"},
-            ])
-        elif entity == "documentation" and name == "status":
-            return render_segmented_field(name, label, [
-                {"label": "Not started", "value": "Not started"},
-                {"label": "In progress", "value": "In progress"},
-                {"label": "Done", "value": "Done"},
-            ])
-        elif entity == "risks" and name == "status":
-            return render_segmented_field(name, label, [
-                {"label": "Ongoing", "value": "Ongoing"},
-                {"label": "Resolved", "value": "Resolved"},
-            ])
-        elif entity == "bom" and name == "status":
-            return render_segmented_field(name, label, [
-                {"label": "Not yet purchased", "value": "Not yet purchased"},
-                {"label": "Purchased", "value": "Purchased"},
-            ])
+        options = _SEG_SPEC.get((entity, name))
+        if options is not None:
+            return render_segmented_field(name, label, options)
         elif field.get("widget") == "textarea":
             return render_textarea_field(name, label)
         else:
@@ -871,19 +1245,19 @@ def App():
             )
 
     def render_project_modal() -> Dict:
-        fields = ENTITY_DEFS["project"]["fields"]
+        fields = _ENTITY_FORMS["project"]["fields"]
         return html.form(
             {"class": "form", "on_submit": handle_submit},
             html.h3({"class": "modal-subtitle"}, "Edit Project"),
             *[render_generic_field("project", f) for f in fields],
             html.div(
-                {"class": "form-actions"},
-                render_button("Cancel", class_="btn glass-btn ghost", on_click=lambda e: close_modal()),
+                _FORM_ACTIONS_ATTRS,
+                render_button("Cancel", class_="btn glass-btn ghost", on_click=action_handler("close_modal")),
                 render_button(
                     "Save",
                     class_="btn glass-btn primary",
                     type="submit",
-                    on_click=lambda e: request_submit(),
+                    on_click=action_handler("request_submit"),
                 ),
             ),
         )
@@ -892,43 +1266,36 @@ def App():
         return html.form(
             {"class": "form", "on_submit": handle_submit},
             render_stepper_field("percent", "Progress", 0, 100, 5),
-            render_segmented_field("phase", "Phase", [
-                {"label": "Concept", "value": "Concept"},
-                {"label": "Developing", "value": "Developing"},
-                {"label": "Prototype", "value": "Prototype"},
-                {"label": "Testing", "value": "Testing"},
-                {"label": "Complete", "value": "Complete"},
-            ]),
+            render_segmented_field("phase", "Phase", PHASE_OPTIONS),
             html.div(
-                {"class": "form-actions"},
-                render_button("Cancel", class_="btn glass-btn ghost", on_click=lambda e: close_modal()),
+                _FORM_ACTIONS_ATTRS,
+                render_button("Cancel", class_="btn glass-btn ghost", on_click=action_handler("close_modal")),
                 render_button(
                     "Save",
                     class_="btn glass-btn primary",
                     type="submit",
-                    on_click=lambda e: request_submit(),
+                    on_click=action_handler("request_submit"),
                 ),
             ),
         )
 
     def render_entity_modal() -> Dict:
         entity = modal_state.get("entity")
-        entity_def = ENTITY_DEFS.get(entity, {})
-        fields = entity_def.get("fields", [])
-        is_edit = bool(modal_state.get("item_id"))
-        title = f"{'Edit' if is_edit else 'Add'} {entity_def.get('label', entity)}"
+        form_spec = _ENTITY_FORMS.get(entity) or _entity_form_spec(entity, {})
+        fields = form_spec["fields"]
+        title = form_spec["edit_title"] if modal_state.get("item_id") else form_spec["add_title"]
         return html.form(
             {"class": "form", "on_submit": handle_submit},
             html.h3({"class": "modal-subtitle"}, title),
             *[render_generic_field(entity, f) for f in fields],
             html.div(
-                {"class": "form-actions"},
-                render_button("Cancel", class_="btn glass-btn ghost", on_click=lambda e: close_modal()),
+                _FORM_ACTIONS_ATTRS,
+                render_button("Cancel", class_="btn glass-btn ghost", on_click=action_handler("close_modal")),
                 render_button(
                     "Save",
                     class_="btn glass-btn primary",
                     type="submit",
-                    on_click=lambda e: request_submit(),
+                    on_click=action_handler("request_submit"),
                 ),
             ),
         )
@@ -941,9 +1308,9 @@ def App():
             html.h3("Delete item?"),
             html.p(f"This will permanently delete the {entity_def.get('label', entity).lower()}."),
             html.div(
-                {"class": "form-actions"},
-                render_button("Cancel", class_="btn glass-btn ghost", on_click=lambda e: close_modal(force=True)),
-                render_button("Delete", class_="btn glass-btn danger", on_click=lambda e: handle_delete_entity()),
+                _FORM_ACTIONS_ATTRS,
+                render_button("Cancel", class_="btn glass-btn ghost", on_click=action_handler("close_modal", True)),
+                render_button("Delete", class_="btn glass-btn danger", on_click=action_handler("handle_delete_entity")),
             ),
         )
 
@@ -955,18 +1322,18 @@ def App():
         if modal_state.get("confirm_close"):
             body = html.div(
                 {"class": "confirm-dialog"},
-                html.p("You have unsaved changes. Discard them?"),
+                UNSAVED_CHANGES_PROMPT,
                 html.div(
-                    {"class": "form-actions"},
-                    render_button("Keep editing", class_="btn glass-btn ghost", on_click=lambda e: dismiss_close_warning()),
-                    render_button("Discard", class_="btn glass-btn primary", on_click=lambda e: confirm_close()),
+                    _FORM_ACTIONS_ATTRS,
+                    render_button("Keep editing", class_="btn glass-btn ghost", on_click=action_handler("dismiss_close_warning")),
+                    render_button("Discard", class_="btn glass-btn primary", on_click=action_handler("confirm_close")),
                 ),
             )
         elif modal_type == "edit_project":
             body = render_project_modal()
         elif modal_type == "edit_progress":
             body = render_progress_modal()
-        elif modal_type in ["new_entity", "edit_entity"]:
+        elif modal_type in _ENTITY_MODAL_TYPES:
             body = render_entity_modal()
         elif modal_type == "delete_confirm":
             body = render_delete_confirm_modal()
@@ -984,7 +1351,7 @@ def App():
                             "class": "btn glass-btn ghost modal-close",
                             "type": "button",
                             "disabled": is_busy,
-                            "on_click": lambda e: close_modal(),
+                            "on_click": action_handler("close_modal"),
                         },
                         "✕",
                     ),
@@ -1000,11 +1367,11 @@ def App():
         
         heater_on = telemetry.get("heater_on")
         heater_label = "ON" if heater_on is True else ("OFF" if heater_on is False else "Unknown")
-        heater_class = "pill-warning" if heater_on is True else ("pill-muted" if heater_on is False else "pill-muted")
+        heater_class = "pill pill-warning" if heater_on is True else "pill pill-muted"
         
         kill_state = telemetry.get("kill_state")
         kill_label = "SHUT DOWN" if kill_state is True else ("RUNNING" if kill_state is False else "Unknown")
-        kill_class = "pill-danger" if kill_state is True else ("pill-success" if kill_state is False else "pill-muted")
+        kill_class = "pill pill-danger" if kill_state is True else ("pill pill-success" if kill_state is False else "pill pill-muted")
         
         telemetry_system_on = derive_system_on(telemetry)
 
@@ -1014,7 +1381,7 @@ def App():
         fallback_system_on = parse_online_state(system_status_row.get("is_online"))
         system_on = telemetry_system_on if telemetry_system_on is not None else fallback_system_on
         system_online_label = "ON" if system_on is True else ("OFF" if system_on is False else "Unknown")
-        system_online_class = "pill-success" if system_on is True else ("pill-danger" if system_on is False else "pill-muted")
+        system_online_class = "pill pill-success" if system_on is True else ("pill pill-danger" if system_on is False else "pill pill-muted")
         uptime_seconds = telemetry.get("uptime_seconds")
         uptime_label = format_uptime(uptime_seconds) if uptime_seconds is not None else "--"
         reason = "" if telemetry_system_on is not None else system_status_row.get("reason", "")
@@ -1022,11 +1389,11 @@ def App():
         if telemetry.get("stale"):
             last_sample = f"{last_sample} (stale)"
         return html.section(
-            {"class": "card glass-surface glass-card"},
+            _CARD_ATTRS,
             html.div(
-                {"class": "section-header"},
+                _SECTION_HEADER_ATTRS,
                 html.h2("System & Heater Control"),
-                html.p({"class": "meta"}, f"Last telemetry: {last_sample}"),
+                html.p(_META_ATTRS, f"Last telemetry: {last_sample}"),
             ),
             (html.p(
                 {"class": "meta", "style": {"color": "#b42318", "marginBottom": "0.75rem"}},
@@ -1035,48 +1402,48 @@ def App():
             html.div(
                 {"class": "telemetry-grid"},
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Temperature"),
-                    html.span({"class": "stat-value"}, temp_label),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Temperature"),
+                    html.span(_STAT_VALUE_ATTRS, temp_label),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Heater"),
-                    html.span({"class": f"pill {heater_class}"}, heater_label),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Heater"),
+                    html.span({"class": heater_class}, heater_label),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Shutdown State"),
-                    html.span({"class": f"pill {kill_class}"}, kill_label),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Shutdown State"),
+                    html.span({"class": kill_class}, kill_label),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "System"),
-                    html.span({"class": f"pill {system_online_class}"}, system_online_label),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "System"),
+                    html.span({"class": system_online_class}, system_online_label),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Uptime"),
-                    html.span({"class": "stat-value"}, uptime_label),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Uptime"),
+                    html.span(_STAT_VALUE_ATTRS, uptime_label),
                 ),
             ),
             (html.div(
                 {"class": "status-info glass-surface glass-panel", "style": {"padding": "1rem", "margin": "1rem 0"}},
-                html.p({"class": "meta"}, f"Reason: {reason}"),
+                html.p(_META_ATTRS, f"Reason: {reason}"),
             ) if reason else None),
             html.div(
-                {"class": "button-group"},
-                render_button("Refresh", class_="btn glass-btn", on_click=lambda e: refresh_telemetry_data()),
-                render_button("Shut Off", class_="btn glass-btn danger", on_click=lambda e: send_heater_command_action(1)),
-                render_button("Resume", class_="btn glass-btn", on_click=lambda e: send_heater_command_action(0)),
+                _BUTTON_GROUP_ATTRS,
+                render_button("Refresh", class_="btn glass-btn", on_click=action_handler("refresh_telemetry_data")),
+                render_button("Shut Off", class_="btn glass-btn danger", on_click=action_handler("send_heater_command_action", 1)),
+                render_button("Resume", class_="btn glass-btn", on_click=action_handler("send_heater_command_action", 0)),
             ),
-            html.p({"class": "meta"}, f"Logged: {telemetry_samples} samples"),
+            html.p(_META_ATTRS, f"Logged: {telemetry_samples} samples"),
         )
 
     def render_ota_field(name: str, label: str, placeholder: str = "", input_type: str = "text") -> Dict:
         return html.div(
-            {"class": "field"},
-            html.label({"class": "label"}, label),
+            _FIELD_ATTRS,
+            field_label(label),
             html.input(
                 {
                     "type": input_type,
@@ -1112,20 +1479,20 @@ def App():
         size_label = display_value(desired_ota.get("size"))
 
         return html.section(
-            {"class": "card glass-surface glass-card"},
+            _CARD_ATTRS,
             html.div(
-                {"class": "section-header"},
+                _SECTION_HEADER_ATTRS,
                 html.div(
                     {},
                     html.h2("Device Twin & OTA"),
-                    html.p({"class": "meta"}, "Azure IoT Hub desired/reported properties for the relay device."),
+                    html.p(_META_ATTRS, "Azure IoT Hub desired/reported properties for the relay device."),
                 ),
                 html.div(
-                    {"class": "button-group"},
+                    _BUTTON_GROUP_ATTRS,
                     render_button(
                         "Refresh Twin",
                         class_="btn glass-btn",
-                        on_click=lambda e: refresh_iot_hub_data(sync_form=False),
+                        on_click=action_handler("refresh_iot_hub_data", False),
                     ),
                     render_button(
                         "Load Desired OTA",
@@ -1146,92 +1513,92 @@ def App():
             html.div(
                 {"class": "telemetry-grid"},
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Device"),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Device"),
                     html.span({"class": "stat-value stat-value-sm"}, device_id),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Connection"),
-                    html.span({"class": f"pill {iot_pill_class(connection_state)}"}, connection_state),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Connection"),
+                    html.span({"class": _pill_class_attr(iot_pill_class(connection_state))}, connection_state),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Telemetry"),
-                    html.span({"class": f"pill {iot_pill_class(listener_state)}"}, listener_state),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Telemetry"),
+                    html.span({"class": _pill_class_attr(iot_pill_class(listener_state))}, listener_state),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Firmware"),
-                    html.span({"class": "stat-value"}, current_version),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Firmware"),
+                    html.span(_STAT_VALUE_ATTRS, current_version),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Target"),
-                    html.span({"class": "stat-value"}, target_version),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Target"),
+                    html.span(_STAT_VALUE_ATTRS, target_version),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "OTA State"),
-                    html.span({"class": f"pill {iot_pill_class(ota_state)}"}, ota_state),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "OTA State"),
+                    html.span({"class": _pill_class_attr(iot_pill_class(ota_state))}, ota_state),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Device Status"),
-                    html.span({"class": f"pill {iot_pill_class(device_status)}"}, device_status),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Device Status"),
+                    html.span({"class": _pill_class_attr(iot_pill_class(device_status))}, device_status),
                 ),
                 html.div(
-                    {"class": "stat-box glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Last Event"),
+                    _STAT_BOX_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Last Event"),
                     html.span({"class": "stat-value stat-value-sm"}, last_event),
                 ),
             ),
             html.div(
                 {"class": "iot-detail-grid"},
                 html.div(
-                    {"class": "status-info glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Last Activity"),
-                    html.p({"class": "meta"}, last_activity),
+                    _STATUS_INFO_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Last Activity"),
+                    html.p(_META_ATTRS, last_activity),
                 ),
                 html.div(
-                    {"class": "status-info glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Last OTA Attempt"),
-                    html.p({"class": "meta"}, last_attempt),
+                    _STATUS_INFO_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Last OTA Attempt"),
+                    html.p(_META_ATTRS, last_attempt),
                 ),
                 html.div(
-                    {"class": "status-info glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "Rollout ID"),
-                    html.p({"class": "meta"}, rollout_id),
+                    _STATUS_INFO_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "Rollout ID"),
+                    html.p(_META_ATTRS, rollout_id),
                 ),
                 html.div(
-                    {"class": "status-info glass-surface glass-panel"},
-                    html.span({"class": "stat-label"}, "SHA-256"),
-                    html.p({"class": "meta"}, sha256),
+                    _STATUS_INFO_ATTRS,
+                    html.span(_STAT_LABEL_ATTRS, "SHA-256"),
+                    html.p(_META_ATTRS, sha256),
                 ),
             ),
             html.div(
                 {"class": "status-info glass-surface glass-panel iot-artifact-panel"},
-                html.span({"class": "stat-label"}, "Artifact"),
+                html.span(_STAT_LABEL_ATTRS, "Artifact"),
                 (
                     html.a(
                         {"class": "link", "href": artifact_url, "target": "_blank", "rel": "noopener"},
                         artifact_url,
                     )
                     if artifact_url
-                    else html.p({"class": "meta"}, "No OTA artifact queued yet.")
+                    else EMPTY_OTA_ARTIFACT
                 ),
-                html.p({"class": "meta"}, f"Action: {action_value}"),
-                html.p({"class": "meta"}, f"Size: {size_label}"),
+                html.p(_META_ATTRS, f"Action: {action_value}"),
+                html.p(_META_ATTRS, f"Size: {size_label}"),
             ),
             html.div(
-                {"class": "status-info glass-surface glass-panel"},
+                _STATUS_INFO_ATTRS,
                 html.div(
-                    {"class": "section-header"},
+                    _SECTION_HEADER_ATTRS,
                     html.div(
                         {},
                         html.h3("Queue OTA Target"),
                         html.p(
-                            {"class": "meta"},
+                            _META_ATTRS,
                             "This writes desired OTA properties to IoT Hub. The current ESP32 firmware must support twins before it will act on them.",
                         ),
                     ),
@@ -1246,12 +1613,12 @@ def App():
                     render_ota_field("action", "Action", "download_and_apply"),
                 ),
                 html.div(
-                    {"class": "button-group"},
+                    _BUTTON_GROUP_ATTRS,
                     render_button(
                         "Queue OTA",
                         class_="btn glass-btn primary",
                         disabled=not iot_hub.get("configured"),
-                        on_click=lambda e: push_ota_target_action(),
+                        on_click=action_handler("push_ota_target_action"),
                     ),
                 ),
             ),
@@ -1259,93 +1626,22 @@ def App():
 
     def render_list_item(entity: str, item: Dict[str, Any], index: int) -> Dict:
         if entity == "tasks":
-            priority_class = {"High": "high", "Medium": "medium", "Low": "low"}.get(item.get("priority"), "")
-            status_class = {"Not started": "", "In progress": "in-progress", "Done": "done"}.get(item.get("status"), "")
             return html.div(
-                {"class": "list-item glass-surface glass-panel task-item"},
-                html.div(
-                    {"class": "item-header"},
-                    html.h4(item.get("task") or "Task"),
-                    html.div(
-                        {"class": "item-badges"},
-                        html.span({"class": f"pill priority-{priority_class}"}, item.get("priority") or ""),
-                        html.span({"class": f"pill status-{status_class}"}, item.get("status") or ""),
-                    ),
-                ),
-                html.p({"class": "meta"}, f"Due: {item.get('due_date') or 'TBD'}"),
-                html.div(
-                    {"class": "item-actions"},
-                    render_button("Edit", class_="btn glass-btn ghost",
-                        on_click=lambda e: open_entity_modal("tasks", "edit", item)),
-                    render_button("Delete", class_="btn glass-btn ghost danger",
-                        on_click=lambda e: open_delete_modal("tasks", item.get("id"))),
+                {"key": row_key("tasks", item, index), "class": "list-item glass-surface glass-panel task-item"},
+                *render_task_summary(item),
+                render_row_actions(
+                    "item-actions", item, row_action_handler("tasks", "edit"), row_action_handler("tasks", "delete")
                 ),
             )
         return None
 
-    def render_table_cell(entity: str, name: str, row: Dict[str, Any]) -> Any:
-        value = row.get(name, "")
-        text_value = "" if value is None else str(value)
-
-        if entity == "documentation" and name == "title":
-            if row.get("location") and row.get("id"):
-                return html.a(
-                    {"class": "link documentation-link", "href": f"/api/documentation/{int(row['id'])}/blob"},
-                    text_value or "Blob",
-                )
-            return text_value
-
-        if entity == "documentation" and name == "location":
-            if value:
-                return html.a(
-                    {"class": "link", "href": str(value), "target": "_blank", "rel": "noopener"},
-                    "Open",
-                )
-            return html.span({"class": "meta"}, "No link")
-
-        if entity == "documentation" and name == "status":
-            return html.span({"class": f"pill {documentation_status_class(value)}"}, str(value or ""))
-
-        if entity == "bom" and name == "link":
-            if value:
-                return html.a(
-                    {"class": "link", "href": str(value), "target": "_blank", "rel": "noopener"},
-                    "Open",
-                )
-            return html.span({"class": "meta"}, "No link")
-
-        if entity == "bom" and name == "status":
-            return html.span({"class": f"pill {bom_status_class(value)}"}, str(value or ""))
-
-        if entity == "risks" and name == "status":
-            return html.span({"class": f"pill {risk_status_class(value)}"}, str(value or ""))
-
-        return text_value
-
-    def render_blob_upload_zone() -> Dict:
+    def render_show_all_button(key: str, total: int) -> Dict:
         return html.div(
-            {
-                "id": "blob-upload-zone",
-                "class": "blob-upload-zone glass-surface glass-panel",
-                "role": "button",
-                "tabIndex": "0",
-                "data-upload-state": "idle",
-            },
-            html.input(
-                {
-                    "id": "blob-upload-input",
-                    "type": "file",
-                    "style": {"display": "none"},
-                }
-            ),
-            html.div({"class": "blob-upload-title", "data-upload-label": "1"}, "Drop a file here or click to upload to Blob"),
-            html.p(
-                {"class": "meta"},
-                "The file is uploaded to Azure Blob Storage and added to Documentation automatically.",
-            ),
+            _BUTTON_GROUP_ATTRS,
+            render_button(f"Show all {total}", class_="btn glass-btn ghost", on_click=action_handler("expand_list", key)),
         )
 
-    def render_table_section(entity: str, rows: List[Dict[str, Any]], section_title: str) -> Dict:
+    def render_table_section(entity: str, rows: List[Dict[str, Any]], section_title: str, show_all: bool) -> Dict:
         action_buttons = []
         upload_zone = None
         if entity == "documentation":
@@ -1353,83 +1649,128 @@ def App():
                 render_button(
                     "Export Telemetry Log CSV",
                     class_="btn glass-btn primary",
-                    on_click=lambda e: export_broadcast_csv_action(),
+                    on_click=action_handler("export_broadcast_csv_action"),
                 )
             )
-            upload_zone = render_blob_upload_zone()
+            upload_zone = BLOB_UPLOAD_ZONE
         action_buttons.append(
-            render_button("Add", class_="btn glass-btn", on_click=lambda e: open_entity_modal(entity, "new"))
+            render_button("Add", class_="btn glass-btn", on_click=action_handler("open_entity_modal", entity, "new"))
         )
 
         if not rows:
             return html.section(
-                {"class": "card glass-surface glass-card"},
+                _CARD_ATTRS,
                 html.div(
-                    {"class": "section-header"},
+                    _SECTION_HEADER_ATTRS,
                     html.h2(section_title),
                 ),
                 upload_zone,
-                html.p({"class": "meta"}, "No items yet."),
-                html.div({"class": "button-group"}, *action_buttons),
+                EMPTY_SECTION_STATE,
+                html.div(_BUTTON_GROUP_ATTRS, *action_buttons),
             )
 
-        entity_def = ENTITY_DEFS.get(entity, {})
-        fields = entity_def.get("fields", [])
-        field_names = [f["name"] for f in fields]
-        field_labels = {f["name"]: f["label"] for f in fields}
-
+        visible_count = len(rows) if show_all else min(len(rows), LIST_RENDER_WINDOW)
         return html.section(
-            {"class": "card glass-surface glass-card"},
+            _CARD_ATTRS,
             html.div(
-                {"class": "section-header"},
+                _SECTION_HEADER_ATTRS,
                 html.h2(section_title),
-                html.div({"class": "button-group"}, *action_buttons),
+                html.div(_BUTTON_GROUP_ATTRS, *action_buttons),
             ),
             upload_zone,
-            html.div(
-                {"class": "table-wrap glass-surface glass-panel"},
-                html.table(
-                    {"class": "table"},
-                    html.thead(
+            reuse_unchanged(f"{entity}:table", (rows, show_all), lambda: render_table(entity, rows, show_all)),
+            render_show_all_button(entity, len(rows)) if visible_count < len(rows) else None,
+        )
+
+    def render_row_actions(class_name: str, row: Dict[str, Any], edit: Callable, delete: Callable) -> Dict:
+        # Row buttons are not disabled per render: the root's aria-busy state blocks them in CSS and
+        # the open handlers check busy_ref, so the rows do not depend on the busy flag.
+        row_id = row.get("id")
+        value = "" if row_id is None else str(row_id)
+        return html.div(
+            {"class": class_name},
+            html.button({"class": "btn glass-btn ghost", "type": "button", "value": value, "on_click": edit}, "Edit"),
+            html.button(
+                {"class": "btn glass-btn ghost danger", "type": "button", "value": value, "on_click": delete},
+                "Delete",
+            ),
+        )
+
+    def render_table(entity: str, rows: List[Dict[str, Any]], show_all: bool) -> Dict:
+        table_spec = _ENTITY_TABLES.get(entity, _EMPTY_TABLE)
+        field_names = table_spec["field_names"]
+        edit_row = row_action_handler(entity, "edit")
+        delete_row = row_action_handler(entity, "delete")
+        visible_rows = rows if show_all else rows[:LIST_RENDER_WINDOW]
+        return html.div(
+            {"class": "table-wrap glass-surface glass-panel"},
+            html.table(
+                {"class": "table"},
+                table_spec["thead"],
+                html.tbody(
+                    (
                         html.tr(
-                            *[html.th(field_labels.get(name, name)) for name in field_names],
-                            html.th("Actions"),
+                            {"key": row_key(entity, row, idx)},
+                            (html.td(render_table_cell(entity, name, row)) for name in field_names),
+                            html.td(render_row_actions("action-buttons", row, edit_row, delete_row)),
                         )
-                    ),
-                    html.tbody(
-                        *[
-                            html.tr(
-                                {"key": row.get("id", idx)},
-                                *[html.td(render_table_cell(entity, name, row)) for name in field_names],
-                                html.td(
-                                    html.div(
-                                        {"class": "action-buttons"},
-                                        render_button("Edit", class_="btn glass-btn ghost",
-                                            on_click=lambda e, r=row: open_entity_modal(entity, "edit", r)),
-                                        render_button("Delete", class_="btn glass-btn ghost danger",
-                                            on_click=lambda e, r=row: open_delete_modal(entity, r.get("id"))),
-                                    ),
-                                ),
-                            )
-                            for idx, row in enumerate(rows)
-                        ]
-                    ),
+                        for idx, row in enumerate(visible_rows)
+                    )
                 ),
             ),
         )
 
+    def reuse_unchanged(key: str, deps: tuple, build: Callable[[], Any]) -> Any:
+        # A refresh replaces every row object, so compare by value: sections whose rows did not
+        # change keep their previous subtree.
+        cached = section_cache_ref.current.get(key)
+        if cached is not None and cached[0] == deps:
+            return cached[1]
+        built = build()
+        section_cache_ref.current[key] = (deps, built)
+        return built
+
+    def render_task_items() -> List[Dict]:
+        bars = data.get("tasks", {}).get("bars", [])
+        if not bars:
+            return [EMPTY_TASKS_STATE]
+        show_all = "tasks" in expanded_lists
+        visible_bars = bars if show_all else bars[:LIST_RENDER_WINDOW]
+        items = reuse_unchanged(
+            "tasks",
+            (visible_bars,),
+            lambda: [render_list_item("tasks", task, idx) for idx, task in enumerate(visible_bars)],
+        )
+        if len(visible_bars) < len(bars):
+            return [*items, render_show_all_button("tasks", len(bars))]
+        return items
+
+    def render_table_sections() -> List[Dict]:
+        return [
+            reuse_unchanged(
+                s["key"],
+                (is_busy, s["title"], s["rows"], s["key"] in expanded_lists),
+                lambda s=s: render_table_section(s["key"], s["rows"], s["title"], s["key"] in expanded_lists),
+            )
+            for s in data.get("sections", [])
+            if s.get("rows") is not None and s.get("key") != "system_status"
+        ]
+
+    # The task list and entity tables only change with the dashboard data, the busy flag or an
+    # expanded list, so typing in a modal or a telemetry poll reuses the same subtrees.
+    task_items = hooks.use_memo(render_task_items, [data, is_busy, expanded_lists])
+    table_sections = hooks.use_memo(render_table_sections, [data, is_busy, expanded_lists])
+
     if data.get("error"):
         return html.div(
             {"id": "project-hub-root"},
-            html.style(GLASS_CSS),
             html.main(
                 {"class": "page"},
                 html.section(
                     {"class": "card glass-surface glass-card error-state"},
-                    html.h1("Dashboard Error"),
+                    ERROR_STATE_TITLE,
                     html.p(data.get("error") or "Unknown error"),
-                    render_button("Retry", class_="btn glass-btn primary",
-                        on_click=lambda e: set_data(load_dashboard_data_safe())),
+                    render_button("Retry", class_="btn glass-btn primary", on_click=action_handler("refresh_dashboard")),
                 ),
             ),
         )
@@ -1437,12 +1778,13 @@ def App():
     project = data.get("project", {})
     development = data.get("development", {})
     tasks = data.get("tasks", {})
-    sections = data.get("sections", [])
-    progress_row = data.get("progress_row", {})
 
     return html.div(
-        {"id": "project-hub-root", "data-unsaved": "1" if (modal_state.get("open") and form_dirty) else "0"},
-        html.style(GLASS_CSS),
+        {
+            "id": "project-hub-root",
+            "data-unsaved": "1" if (modal_state.get("open") and form_dirty) else "0",
+            "aria-busy": "true" if is_busy else "false",
+        },
         html.header(
             {"class": "navbar glass-surface glass-navbar"},
             html.div(
@@ -1456,18 +1798,14 @@ def App():
             ),
             html.div(
                 {"class": "nav-actions"},
-                render_button("Edit Project", class_="btn glass-btn ghost", on_click=lambda e: open_project_modal()),
+                render_button("Edit Project", class_="btn glass-btn ghost", on_click=action_handler("open_project_modal")),
             ),
         ),
         html.main(
             {"class": "page"},
             html.section(
                 {"class": "card glass-surface glass-card progress-section"},
-                html.div(
-                    {"class": "section-header"},
-                    html.h2("Development Phase"),
-                    html.p({"class": "meta"}, "Click a phase to save immediately"),
-                ),
+                PHASE_SECTION_HEADER,
                 html.div(
                     {"class": "progress-display"},
                     html.div(
@@ -1478,7 +1816,7 @@ def App():
                     html.div(
                         {"class": "progress-bar-container"},
                         html.div(
-                            {"class": "progress-bar", "style": {"width": f"{PHASE_TO_PERCENT.get(development.get('phase', 'Concept'), 0)}%"}},
+                            {"class": "progress-bar", "style": _PHASE_WIDTH_STYLES.get(development.get("phase", "Concept"), _ZERO_WIDTH_STYLE)},
                         ),
                     ),
                 ),
@@ -1490,9 +1828,7 @@ def App():
                                 "class": f"phase-btn {'active' if phase == development.get('phase') else ''}",
                                 "type": "button",
                                 "disabled": is_busy,
-                                "on_click": lambda e, p=phase: run_mutation(
-                                    lambda: update_progress({"phase": p, "percent": PHASE_TO_PERCENT.get(p, 0)})
-                                ),
+                                "on_click": phase_handler(phase),
                             },
                             phase,
                         )
@@ -1501,22 +1837,18 @@ def App():
                 ),
             ),
             html.section(
-                {"class": "card glass-surface glass-card"},
+                _CARD_ATTRS,
                 html.div(
-                    {"class": "section-header"},
+                    _SECTION_HEADER_ATTRS,
                     html.h2("Tasks"),
-                    html.p({"class": "meta"}, f"{len(tasks.get('bars', []))} tasks"),
-                ),
-                html.div(
-                    {"class": "list"},
-                    *[render_list_item("tasks", task, idx) for idx, task in enumerate(tasks.get("bars", []))]
-                    if tasks.get("bars") else [html.p({"class": "meta"}, "No tasks yet.")],
+                    html.p(_META_ATTRS, f"{len(tasks.get('bars', []))} tasks"),
                 ),
-                render_button("Add Task", class_="btn glass-btn", on_click=lambda e: open_entity_modal("tasks", "new")),
+                html.div({"class": "list"}, *task_items),
+                render_button("Add Task", class_="btn glass-btn", on_click=action_handler("open_entity_modal", "tasks", "new")),
             ),
             render_telemetry_card(),
             render_iot_hub_card(),
-            *[render_table_section(s["key"], s["rows"], s["title"]) for s in sections if s.get("rows") is not None and s.get("key") != "system_status"],
+            *table_sections,
         ),
         render_modal(),
         (
@@ -1,7 +1,9 @@
-GLASS_CSS = """
+import hashlib
+import re
+
+# Inlined in the page head: everything needed to paint the navbar, progress and task cards.
+GLASS_CSS_CRITICAL = """
 :root {
-  --bg: #eaf2ff;
-  --bg-subtle: #f8faff;
   --glass: rgba(255, 255, 255, 0.58);
   --glass-thick: rgba(255, 255, 255, 0.75);
   --border: rgba(255, 255, 255, 0.5);
@@ -12,31 +14,10 @@ GLASS_CSS = """
   --danger: #ff3b30;
   --success: #34c759;
   --warning: #ff9500;
-  --shadow: 0 24px 60px rgba(10, 20, 45, 0.22);
+  --shadow: 0 8px 16px rgba(10, 20, 45, 0.16);
   --shadow-sm: 0 4px 12px rgba(10, 20, 45, 0.08);
   --blur: 26px;
-  --radius: 16px;
   --radius-lg: 22px;
-  --spacing: 1rem;
-}
-
-@media (prefers-color-scheme: dark) {
-  :root {
-    --bg: #0b1022;
-    --bg-subtle: #111a2e;
-    --glass: rgba(12, 18, 34, 0.62);
-    --glass-thick: rgba(12, 18, 34, 0.82);
-    --border: rgba(255, 255, 255, 0.14);
-    --text: #ecf2ff;
-    --text-secondary: #a7b6d3;
-    --accent: #6bb7ff;
-    --accent-light: #7ee1ff;
-    --danger: #ff453a;
-    --success: #30b140;
-    --warning: #ff9f0a;
-    --shadow: 0 26px 70px rgba(0, 0, 0, 0.45);
-    --shadow-sm: 0 4px 12px rgba(0, 0, 0, 0.2);
-  }
 }
 
 * { box-sizing: border-box; }
@@ -56,20 +37,12 @@ body {
   overflow-x: hidden;
 }
 
-@media (prefers-color-scheme: dark) {
-  body {
-    background: linear-gradient(135deg, #0b1022 0%, #111a38 100%);
-  }
-}
-
 /* Layout */
 .navbar {
   position: sticky;
   top: 0;
   z-index: 100;
   background: linear-gradient(135deg, var(--glass), var(--glass));
-  backdrop-filter: blur(var(--blur)) saturate(180%);
-  -webkit-backdrop-filter: blur(var(--blur)) saturate(180%);
   border-bottom: 1px solid var(--border);
   padding: 1rem 2rem;
   display: flex;
@@ -92,7 +65,9 @@ body {
   flex-wrap: wrap;
 }
 
-.nav-actions {
+.nav-actions,
+.action-buttons,
+.item-actions {
   display: flex;
   gap: 0.5rem;
 }
@@ -105,13 +80,20 @@ body {
   gap: 2rem;
 }
 
+/* Backdrop blur: high-density screens without reduced transparency only */
+@media (prefers-reduced-transparency: no-preference) and (min-resolution: 2dppx) {
+  .navbar,
+  .glass-surface {
+    backdrop-filter: blur(var(--blur)) saturate(180%);
+    -webkit-backdrop-filter: blur(var(--blur)) saturate(180%);
+  }
+}
+
 /* Cards & Surfaces */
 .glass-surface {
   background: linear-gradient(135deg, var(--glass), rgba(255, 255, 255, 0.4));
   border: 1px solid var(--border);
   border-radius: var(--radius-lg);
-  backdrop-filter: blur(var(--blur)) saturate(180%);
-  -webkit-backdrop-filter: blur(var(--blur)) saturate(180%);
   box-shadow: var(--shadow);
   position: relative;
   overflow: hidden;
@@ -139,12 +121,6 @@ body {
 
 .card {
   padding: 2rem;
-  transition: transform 0.2s ease, box-shadow 0.2s ease;
-}
-
-.card:hover {
-  transform: translateY(-2px);
-  box-shadow: 0 32px 80px rgba(10, 20, 45, 0.15);
 }
 
 /* Typography */
@@ -188,69 +164,16 @@ h4 { font-size: 1rem; }
   text-decoration: underline;
 }
 
-/* Forms */
-.form {
-  display: grid;
-  gap: 1.5rem;
-}
-
-.field {
-  display: grid;
-  gap: 0.5rem;
-}
-
-.label {
-  font-size: 0.75rem;
-  text-transform: uppercase;
-  letter-spacing: 0.1em;
-  color: var(--text-secondary);
-  font-weight: 600;
-}
-
-.input,
-.textarea,
-.select {
-  width: 100%;
-  padding: 0.75rem 1rem;
-  border-radius: 10px;
-  border: 1px solid var(--border);
-  background: var(--glass-thick);
-  color: var(--text);
-  font-family: inherit;
-  font-size: 1rem;
-  transition: border-color 0.2s, box-shadow 0.2s;
-  backdrop-filter: blur(12px) saturate(160%);
-  -webkit-backdrop-filter: blur(12px) saturate(160%);
-}
-
-.input:focus,
-.textarea:focus,
-.select:focus {
-  outline: none;
-  border-color: var(--accent);
-  box-shadow: 0 0 0 3px rgba(10, 132, 255, 0.1);
-}
-
-.textarea {
-  min-height: 100px;
-  resize: vertical;
-}
-
-.input::placeholder {
-  color: var(--text-secondary);
-}
-
 /* Buttons */
 .btn {
   padding: 0.625rem 1rem;
   border-radius: 8px;
-  border: 1px solid transparent;
   background: linear-gradient(135deg, rgba(255,255,255,0.8), rgba(255,255,255,0.4));
   color: var(--text);
   font-size: 0.9375rem;
   font-weight: 600;
   cursor: pointer;
-  transition: all 0.15s ease;
+  transition: background 0.15s ease, box-shadow 0.15s ease, filter 0.15s ease;
   display: inline-flex;
   align-items: center;
   justify-content: center;
@@ -261,12 +184,11 @@ h4 { font-size: 1rem; }
 }
 
 .btn:hover:not(:disabled) {
-  transform: scale(1.02);
   box-shadow: 0 6px 16px rgba(10, 20, 45, 0.15);
 }
 
 .btn:active:not(:disabled) {
-  transform: scale(0.98);
+  filter: brightness(0.95);
 }
 
 .btn:disabled {
@@ -275,6 +197,13 @@ h4 { font-size: 1rem; }
   pointer-events: none;
 }
 
+/* Row actions are not re-rendered for busy state; the root's aria-busy blocks them instead */
+[aria-busy="true"] .action-buttons .btn,
+[aria-busy="true"] .item-actions .btn {
+  opacity: 0.5;
+  pointer-events: none;
+}
+
 /* Button variants */
 .btn.primary {
   background: linear-gradient(135deg, var(--accent-light), var(--accent));
@@ -310,51 +239,19 @@ h4 { font-size: 1rem; }
   flex-wrap: wrap;
 }
 
-.action-buttons {
-  display: flex;
-  gap: 0.5rem;
-}
-
-.blob-upload-zone {
-  display: grid;
-  gap: 0.5rem;
-  margin-bottom: 1rem;
-  padding: 1rem 1.25rem;
-  border: 2px dashed rgba(10, 132, 255, 0.28);
-  cursor: pointer;
-  transition: border-color 0.15s ease, transform 0.15s ease, background 0.15s ease;
-}
-
-.blob-upload-zone:hover,
-.blob-upload-zone.dragover {
-  border-color: var(--accent);
-  transform: translateY(-1px);
-}
-
-.blob-upload-zone[data-upload-state="uploading"] {
-  border-color: var(--warning);
-}
-
-.blob-upload-zone[data-upload-state="error"] {
-  border-color: var(--danger);
-}
-
-.blob-upload-zone[data-upload-state="done"] {
-  border-color: var(--success);
-}
-
-.blob-upload-title {
-  font-weight: 600;
-}
-
 /* Segmented controls */
 .segmented {
-  display: grid;
-  grid-template-columns: repeat(auto-fit, minmax(100px, 1fr));
+  display: flex;
+  flex-wrap: wrap;
   gap: 0.75rem;
 }
 
-.seg-btn {
+.segmented > * {
+  flex: 1 1 100px;
+}
+
+.seg-btn,
+.phase-btn {
   padding: 0.625rem 1rem;
   border-radius: 8px;
   border: 1px solid var(--border);
@@ -367,71 +264,25 @@ h4 { font-size: 1rem; }
   text-align: center;
 }
 
-.seg-btn:hover:not(:disabled) {
+.seg-btn:hover:not(:disabled),
+.phase-btn:hover:not(:disabled) {
   background: linear-gradient(135deg, rgba(255,255,255,0.85), rgba(255,255,255,0.5));
 }
 
-.seg-btn.active {
+.seg-btn.active,
+.phase-btn.active {
   background: linear-gradient(135deg, var(--accent-light), var(--accent));
   color: white;
   border-color: var(--accent);
   box-shadow: 0 4px 12px rgba(10, 132, 255, 0.2);
 }
 
-.seg-btn:disabled {
+.seg-btn:disabled,
+.phase-btn:disabled {
   opacity: 0.5;
   cursor: not-allowed;
 }
 
-/* Stepper */
-.stepper {
-  display: flex;
-  align-items: center;
-  gap: 1rem;
-  background: var(--glass-thick);
-  border: 1px solid var(--border);
-  border-radius: 10px;
-  padding: 0.75rem 1rem;
-  width: fit-content;
-}
-
-.stepper-btn {
-  width: 36px;
-  height: 36px;
-  border-radius: 6px;
-  border: 1px solid var(--border);
-  background: linear-gradient(135deg, rgba(255,255,255,0.8), rgba(255,255,255,0.4));
-  color: var(--text);
-  font-size: 1.25rem;
-  font-weight: 600;
-  cursor: pointer;
-  display: flex;
-  align-items: center;
-  justify-content: center;
-  transition: all 0.15s ease;
-}
-
-.stepper-btn:hover:not(:disabled) {
-  transform: scale(1.08);
-  background: linear-gradient(135deg, rgba(255,255,255,0.95), rgba(255,255,255,0.6));
-}
-
-.stepper-btn:active:not(:disabled) {
-  transform: scale(0.94);
-}
-
-.stepper-btn:disabled {
-  opacity: 0.4;
-  cursor: not-allowed;
-}
-
-.stepper-value {
-  min-width: 50px;
-  text-align: center;
-  font-weight: 600;
-  color: var(--text);
-}
-
 /* Progress section */
 .progress-section {
   background: linear-gradient(135deg, rgba(10,132,255,0.05), rgba(107,215,255,0.05));
@@ -486,34 +337,18 @@ h4 { font-size: 1rem; }
 
 .phase-btn {
   padding: 0.75rem 1rem;
-  border-radius: 8px;
-  border: 2px solid var(--border);
-  background: linear-gradient(135deg, rgba(255,255,255,0.7), rgba(255,255,255,0.3));
-  color: var(--text-secondary);
-  font-weight: 600;
-  cursor: pointer;
-  transition: all 0.15s ease;
+  border-width: 2px;
   font-size: 0.875rem;
-  text-align: center;
 }
 
 .phase-btn:hover:not(:disabled) {
   border-color: var(--accent);
-  background: linear-gradient(135deg, rgba(255,255,255,0.85), rgba(255,255,255,0.5));
 }
 
 .phase-btn.active {
-  border-color: var(--accent);
-  background: linear-gradient(135deg, var(--accent-light), var(--accent));
-  color: white;
   box-shadow: 0 4px 12px rgba(10, 132, 255, 0.3);
 }
 
-.phase-btn:disabled {
-  opacity: 0.5;
-  cursor: not-allowed;
-}
-
 /* Lists */
 .list {
   display: grid;
@@ -525,12 +360,11 @@ h4 { font-size: 1rem; }
   border-radius: 12px;
   display: grid;
   gap: 0.75rem;
-  transition: all 0.2s ease;
+  transition: box-shadow 0.2s ease;
 }
 
 .list-item:hover {
-  transform: translateY(-2px);
-  box-shadow: 0 12px 28px rgba(10, 20, 45, 0.12);
+  box-shadow: 0 4px 12px rgba(10, 20, 45, 0.12);
 }
 
 .item-header {
@@ -552,8 +386,6 @@ h4 { font-size: 1rem; }
 }
 
 .item-actions {
-  display: flex;
-  gap: 0.5rem;
   margin-top: 0.5rem;
 }
 
@@ -561,6 +393,187 @@ h4 { font-size: 1rem; }
   border-left: 4px solid var(--accent);
 }
 
+/* Pills/Badges */
+.pill {
+  display: inline-flex;
+  align-items: center;
+  padding: 0.375rem 0.75rem;
+  border-radius: 999px;
+  font-size: 0.8125rem;
+  font-weight: 600;
+  border: 1px solid transparent;
+  white-space: nowrap;
+}
+
+.pill-success, .priority-low, .status-done { background: rgba(52, 199, 89, 0.12); color: var(--success); }
+.pill-danger, .priority-high { background: rgba(255, 59, 48, 0.12); color: var(--danger); }
+.pill-warning, .priority-medium, .status-in-progress { background: rgba(255, 149, 0, 0.12); color: var(--warning); }
+.pill-info { background: rgba(10, 132, 255, 0.12); color: var(--accent); border-color: rgba(10, 132, 255, 0.3); }
+.pill-muted { background: rgba(0, 0, 0, 0.05); color: var(--text-secondary); border-color: rgba(0, 0, 0, 0.08); }
+.pill-success { border-color: rgba(52, 199, 89, 0.3); }
+.pill-danger { border-color: rgba(255, 59, 48, 0.3); }
+.pill-warning { border-color: rgba(255, 149, 0, 0.3); }
+
+/* Error state */
+.error-state {
+  display: grid;
+  gap: 1rem;
+  text-align: center;
+}
+
+/* Dark mode palette */
+@media (prefers-color-scheme: dark) {
+  :root {
+    --glass: rgba(12, 18, 34, 0.62);
+    --glass-thick: rgba(12, 18, 34, 0.82);
+    --border: rgba(255, 255, 255, 0.14);
+    --text: #ecf2ff;
+    --text-secondary: #a7b6d3;
+    --accent: #6bb7ff;
+    --accent-light: #7ee1ff;
+    --danger: #ff453a;
+    --success: #30b140;
+    --warning: #ff9f0a;
+    --shadow: 0 8px 16px rgba(0, 0, 0, 0.4);
+    --shadow-sm: 0 4px 12px rgba(0, 0, 0, 0.2);
+  }
+
+  body {
+    background: linear-gradient(135deg, #0b1022 0%, #111a38 100%);
+  }
+}
+"""
+
+# Forms, tables, modal, toast, dark-mode details and the responsive layout, fetched after first paint.
+GLASS_CSS_DEFERRED = """
+/* Forms */
+.form {
+  display: grid;
+  gap: 1.5rem;
+}
+
+.field {
+  display: grid;
+  gap: 0.5rem;
+}
+
+.label {
+  font-size: 0.75rem;
+  text-transform: uppercase;
+  letter-spacing: 0.1em;
+  color: var(--text-secondary);
+  font-weight: 600;
+}
+
+.input,
+.textarea {
+  width: 100%;
+  padding: 0.75rem 1rem;
+  border-radius: 10px;
+  border: 1px solid var(--border);
+  background: var(--glass-thick);
+  color: var(--text);
+  font-family: inherit;
+  font-size: 1rem;
+  transition: border-color 0.2s, box-shadow 0.2s;
+}
+
+.input:focus,
+.textarea:focus {
+  outline: none;
+  border-color: var(--accent);
+  box-shadow: 0 0 0 3px rgba(10, 132, 255, 0.1);
+}
+
+.textarea {
+  min-height: 100px;
+  resize: vertical;
+}
+
+.input::placeholder {
+  color: var(--text-secondary);
+}
+
+/* Blob upload */
+.blob-upload-zone {
+  display: grid;
+  gap: 0.5rem;
+  margin-bottom: 1rem;
+  padding: 1rem 1.25rem;
+  border: 2px dashed rgba(10, 132, 255, 0.28);
+  cursor: pointer;
+  transition: border-color 0.15s ease, background 0.15s ease;
+}
+
+.blob-upload-zone:hover,
+.blob-upload-zone.dragover {
+  border-color: var(--accent);
+}
+
+.blob-upload-zone[data-upload-state="uploading"] {
+  border-color: var(--warning);
+}
+
+.blob-upload-zone[data-upload-state="error"] {
+  border-color: var(--danger);
+}
+
+.blob-upload-zone[data-upload-state="done"] {
+  border-color: var(--success);
+}
+
+.blob-upload-title {
+  font-weight: 600;
+}
+
+/* Stepper */
+.stepper {
+  display: flex;
+  align-items: center;
+  gap: 1rem;
+  background: var(--glass-thick);
+  border: 1px solid var(--border);
+  border-radius: 10px;
+  padding: 0.75rem 1rem;
+  width: fit-content;
+}
+
+.stepper-btn {
+  width: 36px;
+  height: 36px;
+  border-radius: 6px;
+  border: 1px solid var(--border);
+  background: linear-gradient(135deg, rgba(255,255,255,0.8), rgba(255,255,255,0.4));
+  color: var(--text);
+  font-size: 1.25rem;
+  font-weight: 600;
+  cursor: pointer;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  transition: background 0.15s ease, filter 0.15s ease;
+}
+
+.stepper-btn:hover:not(:disabled) {
+  background: linear-gradient(135deg, rgba(255,255,255,0.95), rgba(255,255,255,0.6));
+}
+
+.stepper-btn:active:not(:disabled) {
+  filter: brightness(0.95);
+}
+
+.stepper-btn:disabled {
+  opacity: 0.4;
+  cursor: not-allowed;
+}
+
+.stepper-value {
+  min-width: 50px;
+  text-align: center;
+  font-weight: 600;
+  color: var(--text);
+}
+
 /* Tables */
 .table-wrap {
   border-radius: 12px;
@@ -574,8 +587,12 @@ h4 { font-size: 1rem; }
   font-size: 0.9375rem;
 }
 
-.table th {
+.table th,
+.table td {
   padding: 1rem;
+}
+
+.table th {
   text-align: left;
   font-weight: 600;
   font-size: 0.75rem;
@@ -587,7 +604,6 @@ h4 { font-size: 1rem; }
 }
 
 .table td {
-  padding: 1rem;
   border-bottom: 1px solid rgba(0,0,0,0.05);
   color: var(--text);
 }
@@ -659,38 +675,11 @@ h4 { font-size: 1rem; }
   word-break: break-word;
 }
 
-/* Pills/Badges */
-.pill {
-  display: inline-flex;
-  align-items: center;
-  padding: 0.375rem 0.75rem;
-  border-radius: 999px;
-  font-size: 0.8125rem;
-  font-weight: 600;
-  border: 1px solid transparent;
-  white-space: nowrap;
-}
-
-.pill-success { background: rgba(52, 199, 89, 0.12); color: var(--success); border-color: rgba(52, 199, 89, 0.3); }
-.pill-danger { background: rgba(255, 59, 48, 0.12); color: var(--danger); border-color: rgba(255, 59, 48, 0.3); }
-.pill-warning { background: rgba(255, 149, 0, 0.12); color: var(--warning); border-color: rgba(255, 149, 0, 0.3); }
-.pill-info { background: rgba(10, 132, 255, 0.12); color: var(--accent); border-color: rgba(10, 132, 255, 0.3); }
-.pill-muted { background: rgba(0, 0, 0, 0.05); color: var(--text-secondary); border-color: rgba(0, 0, 0, 0.08); }
-
-.priority-high { background: rgba(255, 59, 48, 0.12); color: var(--danger); }
-.priority-medium { background: rgba(255, 149, 0, 0.12); color: var(--warning); }
-.priority-low { background: rgba(52, 199, 89, 0.12); color: var(--success); }
-
-.status-done { background: rgba(52, 199, 89, 0.12); color: var(--success); }
-.status-in-progress { background: rgba(255, 149, 0, 0.12); color: var(--warning); }
-
 /* Modal */
 .modal {
   position: fixed;
   inset: 0;
   background: rgba(0, 0, 0, 0.4);
-  backdrop-filter: blur(8px);
-  -webkit-backdrop-filter: blur(8px);
   display: flex;
   align-items: center;
   justify-content: center;
@@ -781,34 +770,16 @@ h4 { font-size: 1rem; }
   display: flex;
   align-items: center;
   gap: 0.75rem;
-  animation: slideInUp 0.3s ease;
+  animation: slideUp 0.3s ease;
   z-index: 999;
 }
 
-@keyframes slideInUp {
-  from {
-    transform: translateY(20px);
-    opacity: 0;
-  }
-  to {
-    transform: translateY(0);
-    opacity: 1;
-  }
-}
-
-/* Error state */
-.error-state {
-  display: grid;
-  gap: 1rem;
-  text-align: center;
-}
-
 /* Utilities */
 .glass-input {
   background: var(--glass);
 }
 
-/* Dark mode adjustments */
+/* Dark mode */
 @media (prefers-color-scheme: dark) {
   .table th {
     background: rgba(255,255,255,0.08);
@@ -820,17 +791,12 @@ h4 { font-size: 1rem; }
     border-color: rgba(150, 185, 255, 0.2);
   }
 
-  .seg-btn.active {
-    background: linear-gradient(135deg, var(--accent-light), var(--accent));
-    color: white;
-  }
-
   .btn {
     background: linear-gradient(135deg, rgba(30, 43, 75, 0.8), rgba(20, 30, 56, 0.6));
     color: var(--text);
   }
 
-  .input, .textarea, .select {
+  .input, .textarea {
     background: rgba(30, 43, 75, 0.7);
     border-color: rgba(150, 185, 255, 0.2);
     color: var(--text);
@@ -842,6 +808,18 @@ h4 { font-size: 1rem; }
   .pill-info { background: rgba(10, 132, 255, 0.15); }
 }
 
+/* Reduced motion: only the classes that animate or transition */
+@media (prefers-reduced-motion: reduce) {
+  .modal, .modal-card, .toast {
+    animation: none;
+  }
+
+  .btn, .seg-btn, .phase-btn, .stepper-btn, .list-item, .progress-bar,
+  .input, .textarea, .blob-upload-zone {
+    transition: none;
+  }
+}
+
 /* Responsive */
 @media (max-width: 768px) {
   .navbar {
@@ -890,3 +868,27 @@ h4 { font-size: 1rem; }
   }
 }
 """
+
+GLASS_CSS = GLASS_CSS_CRITICAL + GLASS_CSS_DEFERRED
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_css(css: str) -> str:
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = re.sub(r"([{;])\s*([-\w]+):\s+", r"\1\2:", css)
+    return css.replace(";}", "}").strip()
+
+
+GLASS_CSS_CRITICAL_MIN = minify_css(GLASS_CSS_CRITICAL)
+
+# The deferred sheet is served once per deploy from /static/glass.css (see routes/assets.py);
+# the content hash in the URL lets browsers cache it as immutable.
+GLASS_CSS_MIN = minify_css(GLASS_CSS_DEFERRED)
+GLASS_CSS_BYTES = GLASS_CSS_MIN.encode("utf-8")
+GLASS_CSS_ETAG = hashlib.blake2b(GLASS_CSS_BYTES, digest_size=16).hexdigest()
+GLASS_CSS_URL = f"/static/glass.css?v={GLASS_CSS_ETAG[:12]}"
@@ -3,46 +3,50 @@ from __future__ import annotations
 import ast
 import importlib.util
 import pkgutil
+import sys
+
+# The shims below only matter on Python 3.14+; older interpreters still ship
+# these names natively, so skip the probes (and their deprecation warnings).
+if sys.version_info >= (3, 14):
+    # Python 3.14: legacy AST node aliases removed. Werkzeug still expects them.
+    if not hasattr(ast, "Str"):
+        ast.Str = ast.Constant  # type: ignore[attr-defined]
+    if not hasattr(ast, "Bytes"):
+        ast.Bytes = ast.Constant  # type: ignore[attr-defined]
+    if not hasattr(ast, "Num"):
+        ast.Num = ast.Constant  # type: ignore[attr-defined]
+    if not hasattr(ast, "NameConstant"):
+        ast.NameConstant = ast.Constant  # type: ignore[attr-defined]
+
+    # Provide legacy attribute access on ast.Constant for older AST APIs.
+    if not hasattr(ast.Constant, "s"):
+        def _get_s(self):
+            return self.value
+
+        def _set_s(self, value):
+            self.value = value
+
+        ast.Constant.s = property(_get_s, _set_s)  # type: ignore[attr-defined]
+
+    if not hasattr(ast.Constant, "n"):
+        def _get_n(self):
+            return self.value
+
+        def _set_n(self, value):
+            self.value = value
+
+        ast.Constant.n = property(_get_n, _set_n)  # type: ignore[attr-defined]
+
+    # Flask 3.0 + Python 3.14 compatibility: pkgutil.get_loader was removed.
+    if not hasattr(pkgutil, "get_loader"):
+        def _get_loader(name: str):
+            try:
+                spec = importlib.util.find_spec(name)
+            except (ValueError, ImportError):
+                return None
+            return spec.loader if spec else None
 
-# Python 3.14: legacy AST node aliases removed. Werkzeug still expects them.
-if not hasattr(ast, "Str"):
-    ast.Str = ast.Constant  # type: ignore[attr-defined]
-if not hasattr(ast, "Bytes"):
-    ast.Bytes = ast.Constant  # type: ignore[attr-defined]
-if not hasattr(ast, "Num"):
-    ast.Num = ast.Constant  # type: ignore[attr-defined]
-if not hasattr(ast, "NameConstant"):
-    ast.NameConstant = ast.Constant  # type: ignore[attr-defined]
-
-# Provide legacy attribute access on ast.Constant for older AST APIs.
-if not hasattr(ast.Constant, "s"):
-    def _get_s(self):
-        return self.value
-
-    def _set_s(self, value):
-        self.value = value
-
-    ast.Constant.s = property(_get_s, _set_s)  # type: ignore[attr-defined]
-
-if not hasattr(ast.Constant, "n"):
-    def _get_n(self):
-        return self.value
-
-    def _set_n(self, value):
-        self.value = value
-
-    ast.Constant.n = property(_get_n, _set_n)  # type: ignore[attr-defined]
-
-# Flask 3.0 + Python 3.14 compatibility: pkgutil.get_loader was removed.
-if not hasattr(pkgutil, "get_loader"):
-    def _get_loader(name: str):
-        try:
-            spec = importlib.util.find_spec(name)
-        except (ValueError, ImportError):
-            return None
-        return spec.loader if spec else None
-
-    pkgutil.get_loader = _get_loader  # type: ignore[attr-defined]
+        pkgutil.get_loader = _get_loader  # type: ignore[attr-defined]
 
 from flask import Flask
 from reactpy.backend.flask import Options, configure
@@ -50,6 +54,7 @@ from reactpy.backend.flask import Options, configure
 from config import FLASK_DEBUG, PORT, RUN_DB_INIT
 from db import close_db, get_db_pool, init_db
 from routes.api import register_api_routes
+from routes.assets import register_asset_routes
 from ui.components import APP_HEAD, App
 
 
@@ -81,6 +86,7 @@ def maybe_init_db_on_startup() -> None:
 
 
 register_api_routes(app)
+register_asset_routes(app)
 maybe_init_db_on_startup()
 
 configure(